@@ -9,6 +9,7 @@ from fastapi import Depends, Request, WebSocket
 from fastapi.datastructures import QueryParams
 from models.enums import AppErrorCode
 from models.tables import User
+from sqlalchemy.sql.elements import False_
 from sqlmodel import select
 from util.queries import EndpointGuard
 
@@ -85,12 +86,13 @@ def Authenticate(  # noqa: C901
         }
 
         if guards:
-            query = select(User).where(User.id == int(user.id))
-            for guard in guards:
-                query = query.where(guard.clause(user, merged_params))
-
-            result = await db.exec(query)
-            user = result.first()
+            clauses = [guard.clause(user, merged_params) for guard in guards]
+            # A guard that already resolved to false() in Python can never match, skip the query
+            if any(isinstance(clause, False_) for clause in clauses):
+                user = None
+            else:
+                result = await db.exec(select(User).where(User.id == int(user.id), *clauses))
+                user = result.first()
             if not user:
                 raise AppException(
                     status_code=403,
@@ -124,7 +126,10 @@ def Authenticate(  # noqa: C901
 
     # TODO check if try: return dependency_http() except FastApiExceptionThatHappensWhenRequestDependencyIsUsedInWebSocketEndpoint: return dependency_ws() is possible to get rid of the parameter
 
-    return Depends(dependency_ws if endpoint == "ws" else dependency_http)
+    endpoint_dependency = dependency_ws if endpoint == "ws" else dependency_http
+    # Exposes the guards to the OpenAPI customization, which reads them from the dependencies of each route
+    endpoint_dependency.guards = tuple(guards)  # type: ignore[attr-defined]
+    return Depends(endpoint_dependency)
 
 
 BasicAuthentication = Annotated[User, Authenticate()]
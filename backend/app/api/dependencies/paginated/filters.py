@@ -8,6 +8,8 @@ def get_filters_dependency(  # noqa: C901
     filterable_field_data: list[FilterableField],
 ) -> Callable[[], Depends]:
     """Generate a FastAPI dependency to parse filters from query parameters."""
+    field_names = frozenset(field.name for field in filterable_field_data)
+    operators = frozenset(Operator.__args__)
 
     def format_field_description(field: FilterableField) -> str:
         """Format a field description with exclusion indicator if applicable."""
@@ -47,12 +49,11 @@ def get_filters_dependency(  # noqa: C901
             if not field or not operator:
                 continue
 
-            is_valid_field = next((f for f in filterable_field_data if f.name == field), None)
-            if not is_valid_field:
+            if field not in field_names:
                 continue
 
             # Skip if operator is not in `Operator` Literal
-            if operator not in Operator.__args__:
+            if operator not in operators:
                 continue
 
             try:
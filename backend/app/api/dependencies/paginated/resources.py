@@ -20,6 +20,7 @@ from models.tables import User
 from sqlalchemy import ColumnElement, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import tuple_
+from sqlalchemy.sql.base import ExecutableOption
 from sqlmodel import SQLModel, select
 from sqlmodel.orm.session import SelectOfScalar
 from util.queries import EndpointGuard
@@ -63,6 +64,7 @@ def PaginatedResource[Model: SQLModel, FilterModel: SQLModel](  # noqa: C901
     ]
     | None = None,
     guards: Sequence[EndpointGuard] = (),
+    options: Sequence[ExecutableOption] = (),
 ) -> Callable[..., Paginated[Model]]:
     """Generate an advanced filter+sort query dependency with pagination.
 
@@ -72,6 +74,7 @@ def PaginatedResource[Model: SQLModel, FilterModel: SQLModel](  # noqa: C901
         key_columns: Custom primary key columns (defaults to base_model.id)
         validate: Optional async enrichment function (payload, user, db)
         guards: Sequence of EndpointGuard instances for access control
+        options: Loader options applied to the final row query (e.g. undefer deferred columns)
 
     """
     filterable_field_data = FilterMeta.from_filter(filter_model)
@@ -230,7 +233,7 @@ def PaginatedResource[Model: SQLModel, FilterModel: SQLModel](  # noqa: C901
             join_condition = tuple_(*resolved_key_columns) == tuple_(*[getattr(paginated_subq.c, col.name) for col in resolved_key_columns])
 
         # Final selection with ordering
-        selection = select(base_model).join(paginated_subq, join_condition).order_by(*subq_order_cols)
+        selection = select(base_model).join(paginated_subq, join_condition).order_by(*subq_order_cols).options(*options)
         result = await db.exec(selection)
         rows = result.all()
 
@@ -250,4 +253,6 @@ def PaginatedResource[Model: SQLModel, FilterModel: SQLModel](  # noqa: C901
 
         return paginated_payload
 
+    # Exposes the guards to the OpenAPI customization, which reads them from the dependencies of each route
+    dependency.guards = tuple(guards)  # type: ignore[attr-defined]
     return Depends(dependency)
@@ -1,6 +1,6 @@
 """Exports the Resource dependency which is a dependency factory for complex filter queries."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import cast, overload
 
 from api.dependencies.authentication import Authenticate, BasicAuthentication
@@ -12,6 +12,7 @@ from models.base import BaseModel
 from models.enums import AppErrorCode
 from models.tables import User
 from sqlalchemy import ColumnElement, Integer, String
+from sqlalchemy.sql.base import ExecutableOption
 from sqlmodel import select
 
 DEFAULT_ID_ALIAS: str = "id"
@@ -28,6 +29,7 @@ def Resource[ResourceModel: BaseModel](
     index_field_type: type = int,
     model_validator: Callable[[ResourceModel, User | None], ResourceModel] | None = None,
     raise_on_not_found: bool = True,
+    options: Sequence[ExecutableOption] = (),
 ) -> Callable[..., ResourceModel]: ...
 
 
@@ -40,6 +42,7 @@ def Resource[ResourceModel: BaseModel](
     index_field_type: type = int,
     model_validator: Callable[[ResourceModel, User | None], ResourceModel] | None = None,
     raise_on_not_found: bool = False,
+    options: Sequence[ExecutableOption] = (),
 ) -> Callable[..., ResourceModel | None]: ...
 
 
@@ -51,6 +54,7 @@ def Resource[ResourceModel: BaseModel](
     index_field_type: type = int,
     model_validator: Callable[[ResourceModel, User | None], ResourceModel] | None = None,
     raise_on_not_found: bool = True,
+    options: Sequence[ExecutableOption] = (),
 ) -> Callable[..., ResourceModel] | Callable[..., ResourceModel | None]:
     """Customizable resource dependency."""
     if key_column is None:
@@ -71,7 +75,7 @@ def Resource[ResourceModel: BaseModel](
             elif isinstance(key_column.type, String):
                 typed_resource_id = str(resource_id)
 
-        query = select(resource).where(key_column == typed_resource_id)
+        query = select(resource).where(key_column == typed_resource_id).options(*options)
         result = await db.exec(query)
         res = result.first()
         if res is None and raise_on_not_found:
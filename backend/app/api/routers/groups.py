@@ -12,7 +12,7 @@ from core.logger import get_logger
 from core.rate_limit import limiter
 from fastapi import Body, Request, Response
 from models.document import DocumentRead, DocumentReorder
-from models.enums import AppErrorCode, Permission
+from models.enums import AppErrorCode, Permission, PermissionFlag
 from models.filter import GroupFilter
 from models.group import (
     GroupCreate,
@@ -25,6 +25,7 @@ from models.group import (
 from models.pagination import Paginated
 from models.reaction import DEFAULT_REACTIONS
 from models.tables import (
+    GROUP_COUNT_OPTIONS,
     Document,
     Group,
     GroupReaction,
@@ -33,7 +34,9 @@ from models.tables import (
     User,
 )
 from sqlalchemy.exc import IntegrityError
-from sqlmodel import select
+from sqlalchemy.orm import raiseload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlmodel import select, update
 from util.api_router import APIRouter
 from util.group_cleanup import cleanup_storage_keys, prepare_group_deletion
 from util.queries import Guard
@@ -56,7 +59,13 @@ router = APIRouter(
 )
 async def list_groups(
     _: BasicAuthentication,
-    groups: Paginated[Group] = PaginatedResource(Group, GroupFilter, guards=[Guard.group_access()]),
+    groups: Paginated[Group] = PaginatedResource(
+        Group,
+        GroupFilter,
+        guards=[Guard.group_access()],
+        # GroupRead never reads memberships, skip the selectin chain through every member's user and share link
+        options=[*GROUP_COUNT_OPTIONS, raiseload(Group.memberships)],
+    ),
 ) -> Paginated[GroupRead]:
     """Get all groups the user is a member of."""
     return groups
@@ -102,6 +111,8 @@ async def create_group(
         ) from None
 
     await db.refresh(group)
+    # A new group has no documents, no need to query the deferred count
+    set_committed_value(group, "document_count", 0)
     return group
 
 
@@ -109,7 +120,7 @@ async def create_group(
 @router.get("/{group_id}", response_model=GroupRead)
 async def read_group(
     _: User = Authenticate([Guard.group_access()]),
-    group: Group = Resource(Group, param_alias="group_id"),
+    group: Group = Resource(Group, param_alias="group_id", options=GROUP_COUNT_OPTIONS),
 ) -> Group:
     """Get a group by ID. Reject if the user is not a member."""
     return group
@@ -119,7 +130,7 @@ async def read_group(
 async def update_group(
     db: Database,
     session_user: User = Authenticate([Guard.group_access({Permission.ADMINISTRATOR})]),
-    group: Group = Resource(Group, param_alias="group_id"),
+    group: Group = Resource(Group, param_alias="group_id", options=GROUP_COUNT_OPTIONS),
     group_update: GroupUpdate = Body(...),
 ) -> Group:
     """Update a group."""
@@ -152,18 +163,18 @@ async def update_group(
             detail="Group with this name already exists.",
         ) from None
 
-    # if default permissions were changed, update all existing memberships to include at least those permissions
+    # if default permissions were changed, update all existing memberships to include at least those permissions,
+    # OR-ing the mask in a single UPDATE instead of loading and saving each membership
     if group_update.default_permissions is not None:
-        result = await db.exec(
-            select(Membership).where(
+        default_mask = PermissionFlag.from_permissions(group_update.default_permissions)
+        await db.exec(
+            update(Membership)
+            .where(
                 Membership.group_id == group.id,
                 ~Membership.permissions.contains(group_update.default_permissions),
             )
+            .values(permissions=Membership.permissions.op("|")(default_mask))
         )
-        memberships_missing_permissions = result.all()
-        for membership in memberships_missing_permissions:
-            membership.permissions = list(set(membership.permissions).union(set(group_update.default_permissions)))
-            db.add(membership)
         await db.commit()
 
     await db.refresh(group)
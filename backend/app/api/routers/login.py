@@ -20,8 +20,10 @@ from fastapi import Body, Depends, Request, Response
 from fastapi.security import OAuth2PasswordRequestForm
 from itsdangerous import BadSignature, SignatureExpired, URLSafeTimedSerializer
 from models.enums import AppErrorCode
-from models.tables import Membership, User
+from models.tables import Membership, ShareLink, User
 from models.user import PasswordResetVerify
+from sqlalchemy import delete
+from sqlalchemy.orm import load_only
 from sqlmodel import or_, select
 from util.api_router import APIRouter
 
@@ -43,11 +45,16 @@ async def login(
 ) -> Token:
     """Return a JWT if the user is authenticated successfully."""
     login_input = form_data.username
-    query = select(User).where(
-        or_(
-            User.username == login_input,
-            User.email == login_input.lower().strip(),
+    # Only the columns needed to check the password and sign the tokens
+    query = (
+        select(User)
+        .where(
+            or_(
+                User.username == login_input,
+                User.email == login_input.lower().strip(),
+            )
         )
+        .options(load_only(User.id, User.password, User.verified, User.is_guest, User.secret, raiseload=True))
     )
     result = await db.exec(query)
     user = result.first()
@@ -114,16 +121,15 @@ async def refresh(
         token_type="bearer",
     )
 
-    # Find all memberships for the user where a share_link is present and delete the membership if the share_link is expired or if
-    result = await db.exec(
-        select(Membership).where(
+    # Delete the user's memberships that were granted through a share link that has since expired,
+    # joined in a single DELETE ... USING instead of loading each membership and its share link
+    await db.exec(
+        delete(Membership).where(
             Membership.user_id == user.id,
-            Membership.is_expired == True,  # noqa: E712
+            Membership.sharelink_id == ShareLink.id,
+            ShareLink.is_expired,
         )
     )
-    invalid_memberships = result.all()
-    for membership in invalid_memberships:
-        await db.delete(membership)
     await db.commit()
 
     response.set_cookie(
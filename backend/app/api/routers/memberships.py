@@ -23,6 +23,7 @@ from models.score import (
     ScoreRead,
 )
 from models.tables import (
+    GROUP_COUNT_OPTIONS,
     Comment,
     CommentTag,
     Document,
@@ -37,6 +38,7 @@ from models.tables import (
 )
 from sqlalchemy import case, func, or_
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import raiseload, selectinload
 from sqlmodel import select
 from util.api_router import APIRouter
 from util.cache import get_cached, score_cache_key, set_cached
@@ -65,6 +67,7 @@ async def list_memberships(
         MembershipFilter,
         key_columns=[Membership.user_id, Membership.group_id],
         guards=[Guard.group_access(filter_column=Membership.group_id)],
+        options=[selectinload(Membership.group).options(*GROUP_COUNT_OPTIONS, raiseload(Group.memberships))],
     ),
 ) -> Paginated[MembershipRead]:
     """Get all group memberships. By default only returns memberships for groups the user is a member of."""
@@ -77,7 +80,7 @@ async def get_membership(
     session_user: User = Authenticate(
         [Guard.group_access()],
     ),
-    group: Group = Resource(Group, param_alias="group_id"),
+    group: Group = Resource(Group, param_alias="group_id", options=GROUP_COUNT_OPTIONS),
     member: User = Resource(User, param_alias="user_id"),
 ) -> MembershipRead:
     """Get a specific group membership."""
@@ -10,6 +10,7 @@ from core.auth import (
     generate_token,
     hash_password,
 )
+from core.clock import now
 from core.logger import get_logger
 from core.rate_limit import get_cache_key, limiter
 from fastapi import Request, Response
@@ -195,9 +196,9 @@ async def _register_anonymous_user(
     sharelink_token: str,
 ) -> Token:
     """Handle anonymous user registration with sharelink token."""
-    # Find the sharelink by token
-    result = await db.exec(select(ShareLink).where(ShareLink.token == sharelink_token))
-    share_link: ShareLink | None = result.first()
+    # Find the sharelink by token, only reading columns covered by the token index
+    result = await db.exec(select(ShareLink.expires_at, ShareLink.allow_anonymous_access).where(ShareLink.token == sharelink_token))
+    share_link = result.first()
 
     if not share_link:
         raise AppException(
@@ -207,7 +208,7 @@ async def _register_anonymous_user(
         )
 
     # Check if expired
-    if share_link.expires_at and share_link.expires_at < datetime.now(UTC):
+    if share_link.expires_at and share_link.expires_at < now():
         raise AppException(
             status_code=403,
             detail="Share link has expired",
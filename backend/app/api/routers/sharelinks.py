@@ -20,12 +20,21 @@ from models.sharelink import (
     ShareLinkReadFromToken,
     ShareLinkUpdate,
 )
-from models.tables import Group, Membership, ShareLink, User
+from models.tables import (
+    GROUP_COUNT_OPTIONS,
+    USER_READ_OPTIONS,
+    Group,
+    Membership,
+    ShareLink,
+    User,
+)
+from sqlalchemy import delete
 from sqlalchemy.exc import IntegrityError
-from sqlmodel import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, selectinload
+from sqlmodel import col, select
 from util.api_router import APIRouter
 from util.queries import Guard
-from util.response import ExcludableFieldsJSONResponse
 
 router = APIRouter(
     prefix="/sharelinks",
@@ -37,17 +46,49 @@ root_router = APIRouter(
 )
 
 
+async def _to_share_link_read(
+    payload: Paginated[ShareLink],
+    _user: User | None,
+    db: AsyncSession,
+) -> Paginated[ShareLinkRead]:
+    """Convert the loaded share links to read models without revalidating them."""
+    authors = await _load_authors(db, {s.author_id for s in payload.data if s.author_id is not None})
+    data = [
+        ShareLinkRead.from_orm_trusted(s, author=authors.get(s.author_id))
+        for s in payload.data
+    ]
+    return Paginated[ShareLinkRead].model_construct(**{**dict(payload), "data": data})
+
+
+async def _load_authors(db: AsyncSession, author_ids: set[int]) -> dict[int, User]:
+    """Load the distinct authors of a page of share links in a single query."""
+    if not author_ids:
+        return {}
+    result = await db.exec(select(User).where(col(User.id).in_(author_ids)).options(*USER_READ_OPTIONS))
+    return {author.id: author for author in result.all()}
+
+
 @router.get(
     "/",
     response_model=Paginated[ShareLinkRead],
-    response_class=ExcludableFieldsJSONResponse,
 )
 async def list_share_links(
     _: BasicAuthentication,
-    share_links: Paginated[ShareLink] = PaginatedResource(ShareLink, ShareLinkFilter, guards=[Guard.sharelink_access()]),
-) -> Paginated[ShareLinkRead]:
+    share_links: Paginated[ShareLinkRead] = PaginatedResource(
+        ShareLink,
+        ShareLinkFilter,
+        guards=[Guard.sharelink_access()],
+        validate=_to_share_link_read,
+    ),
+) -> Response:
     """Get all share links for the group."""
-    return share_links
+    # The page already holds constructed read models, serialize it once instead of
+    # letting FastAPI dump and revalidate it against the response model
+    excluded_fields = set(share_links.excluded_fields)
+    return Response(
+        content=share_links.model_dump_json(exclude={"data": {"__all__": excluded_fields}} if excluded_fields else None),
+        media_type="application/json",
+    )
 
 
 @root_router.get("/{token}", response_model=ShareLinkReadFromToken)
@@ -58,6 +99,7 @@ async def get_share_link_from_token(
         ShareLink,
         param_alias="token",
         key_column=ShareLink.token,
+        options=[selectinload(ShareLink.group).options(*GROUP_COUNT_OPTIONS, raiseload(Group.memberships))],
     ),
 ) -> ShareLinkReadFromToken:
     """Get a single share link by token."""
@@ -67,7 +109,7 @@ async def get_share_link_from_token(
             error_code=AppErrorCode.SHARELINK_EXPIRED,
             detail="This share link has expired",
         )
-    return share_link
+    return ShareLinkReadFromToken.from_orm_trusted(share_link)
 
 
 @router.post("/", response_model=ShareLinkRead)
@@ -102,7 +144,7 @@ async def create_share_link(
     db.add(share_link)
     await db.commit()
     await db.refresh(share_link)
-    return share_link
+    return ShareLinkRead.from_orm_trusted(share_link, author=user)
 
 
 @router.put("/{share_link_id}", response_model=ShareLinkRead)
@@ -169,7 +211,7 @@ async def update_share_link(
 
     await db.commit()
     await db.refresh(share_link)
-    return share_link
+    return ShareLinkRead.from_orm_trusted(share_link, author=user)
 
 
 @router.delete("/{share_link_id}")
@@ -180,6 +222,9 @@ async def delete_share_link(
     _group: Group = Resource(Group, param_alias="group_id"),
 ) -> Response:
     """Delete a share link."""
+    # ShareLink.memberships is never loaded and the foreign key only sets NULL,
+    # so revoke the access granted through the link explicitly
+    await db.exec(delete(Membership).where(Membership.sharelink_id == share_link.id))
     await db.delete(share_link)
     await db.commit()
     return Response(status_code=204)
@@ -17,6 +17,7 @@ from models.filter import (
 )
 from models.pagination import Paginated
 from models.tables import (
+    USER_READ_OPTIONS,
     Comment,
     Document,
     Group,
@@ -68,14 +69,14 @@ async def read_current_user(user: User = Authenticate()) -> User:
 )
 async def list_users(
     _: BasicAuthentication,
-    users: Paginated[User] = PaginatedResource(User, UserFilter),
+    users: Paginated[User] = PaginatedResource(User, UserFilter, options=USER_READ_OPTIONS),
 ) -> Paginated[UserRead]:
     """Get all users."""
     return users
 
 
 @router.get("/{user_id}", response_model=UserRead)
-async def read_user(_: BasicAuthentication, user: User = Resource(User, param_alias="user_id")) -> User:
+async def read_user(_: BasicAuthentication, user: User = Resource(User, param_alias="user_id", options=USER_READ_OPTIONS)) -> User:
     """Get a user by ID."""
     return user
 
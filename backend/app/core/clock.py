@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from contextvars import ContextVar, Token
+from datetime import UTC, datetime
+
+# Context variable pinning "now" for the duration of a request
+request_now_context: ContextVar[datetime | None] = ContextVar("request_now", default=None)
+
+
+def set_request_now() -> Token[datetime | None]:
+    """Pin the current time for this request and return the token needed to reset it."""
+    return request_now_context.set(datetime.now(UTC))
+
+
+def reset_request_now(token: Token[datetime | None]) -> None:
+    """Release the time pinned by `set_request_now`."""
+    request_now_context.reset(token)
+
+
+def now() -> datetime:
+    """Return the time pinned for the current request, or the wall clock outside of a request."""
+    return request_now_context.get() or datetime.now(UTC)
@@ -66,6 +66,7 @@ DIRECT_DATABASE_URL: str = f"postgresql+asyncpg://{quote(user)}:{quote(password)
 REDIS_PASSWORD: str = os.getenv("REDIS_PASSWORD")
 REDIS_PORT: int = int(os.getenv("REDIS_PORT", "6379"))
 REDIS_HOST: str = os.getenv("REDIS_HOST", "localhost")
+REDIS_CACHE_MAX_CONNECTIONS: int = int(os.getenv("REDIS_CACHE_MAX_CONNECTIONS", "50"))
 
 # Storage
 STORAGE_DIR = os.getenv("STORAGE_DIR", os.path.join(backend_path, "storage"))
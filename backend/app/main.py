@@ -28,6 +28,7 @@ from api.routers.tasks import router as TaskRouter
 from api.routers.users import router as UserRouter
 from core import config
 from core.app_exception import AppException
+from core.clock import reset_request_now, set_request_now
 from core.logger import get_current_user, get_logger
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError, ResponseValidationError
@@ -42,9 +43,10 @@ from fastapi.responses import (
 from fastapi.staticfiles import StaticFiles
 from models.app_error import AppError
 from models.enums import AppErrorCode
+from models.filter import precompute_filters
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
-from util.api_router import APIRouter
+from util.api_router import APIRouter, StripTrailingSlashMiddleware
 from util.ip import anonymize_ip, get_client_ip
 from util.openapi import custom_openapi
 
@@ -68,6 +70,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         app_logger.error("Error during dependency verification: %s", e, exc_info=True)
         sys.exit(1)
 
+    # Build the filterable fields of all filter models up front so the first
+    # request to each paginated endpoint does not pay for it
+    precompute_filters()
+
     # Start periodic cleanup task (log retention, abandoned accounts)
     from util.cleanup import periodic_cleanup_loop
 
@@ -275,6 +281,9 @@ app.mount("/static", StaticFiles(directory=static_path), name="static")
 from slowapi.middleware import SlowAPIMiddleware  # noqa: E402
 
 app.add_middleware(SlowAPIMiddleware)
+# Routes are registered without a trailing slash (see util/api_router.py), this must wrap
+# SlowAPIMiddleware so its route lookup sees the stripped path as well.
+app.add_middleware(StripTrailingSlashMiddleware)
 
 # CORSMiddleware must be added last so it is the outermost
 # middleware, ensuring CORS headers are present on all responses
@@ -314,6 +323,16 @@ async def add_security_headers(request: Request, call_next: Callable) -> Respons
     return response
 
 
+@app.middleware("http")
+async def pin_request_clock(request: Request, call_next: Callable) -> Response:
+    """Pin the current time so every expiry check within a request compares against the same instant."""
+    token = set_request_now()
+    try:
+        return await call_next(request)
+    finally:
+        reset_request_now(token)
+
+
 @app.middleware("http")
 async def log_requests(request: Request, call_next: Callable) -> Response:
     """Log all incoming HTTP requests."""
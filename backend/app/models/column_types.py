@@ -0,0 +1,42 @@
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import ColumnElement, SmallInteger
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator
+
+from models.enums import Permission, PermissionFlag
+
+
+class PermissionMask(TypeDecorator):
+    """Store a collection of permissions as a `PermissionFlag` bitmask in a smallint column.
+
+    Python-side the value stays a list of `Permission` so existing membership checks keep working,
+    `contains` compiles to a bitwise test instead of an array containment.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    class comparator_factory(TypeDecorator.Comparator):
+        """Comparator adding bitwise containment checks to permission mask columns."""
+
+        def contains(self, other: Iterable[Permission], **kwargs: Any) -> ColumnElement[bool]:  # noqa: ANN401
+            """Return whether the mask holds every permission in `other`."""
+            mask = int(PermissionFlag.from_permissions(other))
+            return self.expr.op("&", return_type=SmallInteger)(mask) == mask
+
+        def overlaps(self, other: Iterable[Permission]) -> ColumnElement[bool]:
+            """Return whether the mask holds any permission in `other`."""
+            mask = int(PermissionFlag.from_permissions(other))
+            return self.expr.op("&", return_type=SmallInteger)(mask) != 0
+
+    def process_bind_param(self, value: Iterable[Permission] | int | None, dialect: Dialect) -> int | None:
+        """Fold the permissions into their bitmask."""
+        if value is None or isinstance(value, int):
+            return value
+        return int(PermissionFlag.from_permissions(value))
+
+    def process_result_value(self, value: int | None, dialect: Dialect) -> list[Permission]:
+        """Expand the stored bitmask into its permissions."""
+        return PermissionFlag(value or 0).to_permissions()
@@ -1,4 +1,5 @@
-from enum import Enum, StrEnum
+from collections.abc import Iterable
+from enum import Enum, IntFlag, StrEnum
 
 
 # ENUMS
@@ -86,6 +87,30 @@ class Permission(StrEnum):
     ADD_REACTIONS = "add_reactions"
 
 
+class PermissionFlag(IntFlag):
+    """Bitmask mirror of `Permission` used for compact storage and bitwise permission checks.
+
+    The bit values are persisted, only ever append new members.
+    """
+
+    ADMINISTRATOR = 1
+    ADD_COMMENTS = 2
+    VIEW_RESTRICTED_COMMENTS = 4
+    ADD_REACTIONS = 8
+
+    @classmethod
+    def from_permissions(cls, permissions: Iterable[Permission]) -> "PermissionFlag":
+        """Fold a collection of permissions into a single mask."""
+        mask = cls(0)
+        for permission in permissions:
+            mask |= cls[Permission(permission).name]
+        return mask
+
+    def to_permissions(self) -> list[Permission]:
+        """Expand the mask back into the permissions it contains, in bit order."""
+        return [Permission[flag.name] for flag in self]
+
+
 class ViewMode(StrEnum):
     """Document view mode settings.
 
@@ -1,13 +1,22 @@
 import enum
-import json
+import functools
 from collections.abc import Callable
 from dataclasses import dataclass
+from dataclasses import field as dataclass_field
 from datetime import datetime
-from typing import Any, Literal, get_args, get_origin
+from typing import Any, ClassVar, Literal, get_args, get_origin
 
+import orjson
 from pydantic import EmailStr, Field
 from pydantic.fields import FieldInfo
-from sqlalchemy import ColumnElement, and_
+from sqlalchemy import (
+    BindParameter,
+    ColumnElement,
+    Select,
+    and_,
+    bindparam,
+    or_,
+)
 from sqlalchemy.orm import InstrumentedAttribute
 from sqlmodel import SQLModel, exists, select
 from sqlmodel.main import default_registry
@@ -25,20 +34,218 @@ from models.tables import (
 Base = default_registry.generate_base()
 Operator = Literal["==", ">=", "<=", ">", "<", "ilike", "like", "exists", "!=", "in", "notin"]
 OperatorMap = {
-    "equals": {"==", "!=", "in", "notin"},
-    "contains": {"ilike", "like", "==", "!=", "in", "notin"},
-    "numeric": {"==", ">=", "<=", ">", "<", "!=", "in", "notin"},
-    "exists": {"exists"},
+    "equals": frozenset({"==", "!=", "in", "notin"}),
+    "contains": frozenset({"ilike", "like", "==", "!=", "in", "notin"}),
+    "numeric": frozenset({"==", ">=", "<=", ">", "<", "!=", "in", "notin"}),
+    "exists": frozenset({"exists"}),
+}
+
+
+class _OperatorTag(enum.IntEnum):
+    """Integer tag of each operator, used to index the per-field handler and converter tables.
+
+    Operators are resolved to their tag once per filter so clause building dispatches on ints instead of comparing strings.
+    """
+
+    EQ = 0
+    NE = 1
+    GE = 2
+    LE = 3
+    GT = 4
+    LT = 5
+    ILIKE = 6
+    LIKE = 7
+    EXISTS = 8
+    IN = 9
+    NOTIN = 10
+
+
+_OP_TAG: dict[str, _OperatorTag] = {
+    "==": _OperatorTag.EQ,
+    "!=": _OperatorTag.NE,
+    ">=": _OperatorTag.GE,
+    "<=": _OperatorTag.LE,
+    ">": _OperatorTag.GT,
+    "<": _OperatorTag.LT,
+    "ilike": _OperatorTag.ILIKE,
+    "like": _OperatorTag.LIKE,
+    "exists": _OperatorTag.EXISTS,
+    "in": _OperatorTag.IN,
+    "notin": _OperatorTag.NOTIN,
+}
+
+# Common spellings of boolean filter values, anything else is lowercased first
+_TRUTHY = frozenset({"1", "true", "True", "TRUE"})
+_FALSY = frozenset({"0", "false", "False", "FALSE"})
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean filter value, "1" and "true" in any casing are truthy."""
+    if value in _TRUTHY:
+        return True
+    if value in _FALSY:
+        return False
+    return str(value).lower() in _TRUTHY
+
+
+# Datetime filter values repeat across pages and requests, so parsing them is memoized
+@functools.lru_cache(maxsize=1024)
+def _parse_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 filter value."""
+    return datetime.fromisoformat(value)
+
+
+def _parse_array(value: str) -> list[Any]:
+    """Parse the JSON array value of an in/notin filter."""
+    try:
+        parsed = orjson.loads(value)
+        if not isinstance(parsed, list):
+            raise ValueError("Parsed JSON is not a list")
+    except Exception as e:
+        raise ValueError("Value for 'in'/'notin' operator must be a JSON array") from e
+    return parsed
+
+
+def _parse_str_array(value: str) -> list[str]:
+    """Parse an in/notin value into a list of strings."""
+    items = _parse_array(value)
+    for elem in items:
+        if not isinstance(elem, (str, int, float)):
+            raise ValueError(f"Invalid array element type: {type(elem)}")
+    return [str(elem) for elem in items]
+
+
+def _parse_unsupported_array(value: str) -> list[Any]:
+    """Reject in/notin values for types that only support scalar comparisons."""
+    _parse_array(value)
+    raise ValueError("Only string and numeric types supported for 'in'/'notin' operator")
+
+
+@functools.cache
+def _value_converters(inferred_type: type) -> tuple[Callable[[str], Any], ...]:
+    """Build the raw value converters of a filter type, indexed by operator tag.
+
+    Resolving them once per type keeps the per-request conversion to a single indexed call instead of re-checking the type.
+    """
+    if inferred_type is bool:
+        return (_parse_bool,) * len(_OP_TAG)
+    if inferred_type is datetime:
+        converters = [_parse_datetime] * len(_OP_TAG)
+    else:
+
+        def to_pattern(value: str) -> str:
+            """Wrap the value in a like pattern matching it anywhere."""
+            return f"%{inferred_type(value)}%"
+
+        def to_numeric_array(value: str) -> list[Any]:
+            """Parse an in/notin value into a list of the numeric type."""
+            items = _parse_array(value)
+            try:
+                return [inferred_type(elem) for elem in items]
+            except (TypeError, ValueError) as exc:
+                raise ValueError(f"Invalid numeric array element: {exc}") from exc
+
+        converters = [inferred_type] * len(_OP_TAG)
+        converters[_OperatorTag.ILIKE] = converters[_OperatorTag.LIKE] = to_pattern
+        if inferred_type is str:
+            converters[_OperatorTag.IN] = converters[_OperatorTag.NOTIN] = _parse_str_array
+        elif inferred_type in (int, float):
+            converters[_OperatorTag.IN] = converters[_OperatorTag.NOTIN] = to_numeric_array
+        else:
+            converters[_OperatorTag.IN] = converters[_OperatorTag.NOTIN] = _parse_unsupported_array
+    converters[_OperatorTag.EXISTS] = _parse_bool
+    return tuple(converters)
+
+
+def _not_equal_or_null(field: ColumnElement, value: Any) -> ColumnElement[bool]:  # noqa: ANN401
+    """Match rows where the field differs from the value, treating NULL as different."""
+    return or_(field != value, field.is_(None))
+
+
+# Base where clause builders indexed by operator tag, each takes the filtered
+# field and the converted (bound) value
+_OP_HANDLERS: tuple[Callable[[ColumnElement, Any], ColumnElement[bool]], ...] = (
+    lambda field, value: field == value,  # EQ
+    _not_equal_or_null,  # NE
+    lambda field, value: field >= value,  # GE
+    lambda field, value: field <= value,  # LE
+    lambda field, value: field > value,  # GT
+    lambda field, value: field < value,  # LT
+    lambda field, value: field.ilike(value),  # ILIKE
+    lambda field, value: field.like(value),  # LIKE
+    lambda field, value: field.is_not(None) if value else field.is_(None),  # EXISTS
+    lambda field, value: field.in_(value),  # IN
+    lambda field, value: ~field.in_(value),  # NOTIN
+)
+# Joined fields build != as a negated EXISTS around an equality match
+_JOIN_OP_HANDLERS = (*_OP_HANDLERS[:_OperatorTag.NE], _OP_HANDLERS[_OperatorTag.EQ], *_OP_HANDLERS[_OperatorTag.NE + 1 :])
+
+
+@functools.cache
+def _resolve_operators(
+    filter_type: str,
+    exclude_operators: frozenset[str],
+    include_operators: frozenset[str],
+) -> tuple[tuple[Operator, ...], frozenset[_OperatorTag]]:
+    """Resolve the allowed operators of a filter type in tag order, along with their tags."""
+    ops = (OperatorMap.get(filter_type, frozenset()) - exclude_operators) | include_operators
+    operators = tuple(sorted(ops, key=_OP_TAG.__getitem__))
+    return operators, frozenset(_OP_TAG[operator] for operator in operators)
+
+
+# Filter types of the plain annotations used by filter models, looked up by
+# identity before falling back to the subclass checks in `FilterMeta.infer_type`
+_TYPE_DISPATCH: dict[type, tuple[type, str]] = {
+    bool: (bool, "equals"),
+    int: (int, "numeric"),
+    datetime: (datetime, "numeric"),
+    str: (str, "contains"),
+    EmailStr: (EmailStr, "contains"),
+    type(None): (bool, "exists"),
 }
 
+# Every BaseFilterModel subclass, registered on class creation so their filterable
+# fields can be built eagerly at startup via `precompute_filters`
+_FILTER_MODELS: list[type["BaseFilterModel"]] = []
+
 
 class BaseFilterModel(SQLModel):
     """Base class for filter models that provides filter metadata without serialization issues."""
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:  # noqa: ANN401
+        """Register the filter model so its fields can be precomputed."""
+        super().__init_subclass__(**kwargs)
+        _FILTER_MODELS.append(cls)
+
+    # Mapping of field names to FilterMeta objects, subclasses override it to
+    # define their filter metadata. Built once when the class body executes.
+    _FILTER_METADATA: ClassVar[dict[str, "FilterMeta"]] = {}
+
     @classmethod
     def get_filter_metadata(cls) -> dict[str, "FilterMeta"]:
-        """Return a mapping of field names to FilterMeta objects. Subclasses should override this method to define their filter metadata."""
-        return {}
+        """Return a mapping of field names to FilterMeta objects."""
+        return cls._FILTER_METADATA
+
+    @classmethod
+    @functools.cache
+    def filterable_fields(cls) -> list["FilterableField"]:
+        """Build the filterable fields of this filter model.
+
+        The result only depends on the class and is cached, callers share the returned list and must not mutate it.
+        """
+        fields: list[FilterableField] = []
+        model_fields = cls.model_fields
+
+        for field_name, filter_meta in cls.get_filter_metadata().items():
+            # Metadata without a declared field has no annotation to infer its type from
+            model_field = model_fields.get(field_name)
+            if model_field is None:
+                continue
+
+            filterable_field = filter_meta.to_filterable_field(field_name, model_field)
+            if filterable_field:
+                fields.append(filterable_field)
+        return fields
 
 
 class Filter(SQLModel):
@@ -47,20 +254,20 @@ class Filter(SQLModel):
     value: str = Field()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class JoinInfo:
     target: InstrumentedAttribute
     join_type: Literal["inner", "outer"] = "outer"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FilterableField:
     """Represents a filterable field with dot path, join path (list of join functions), and clause."""
 
     name: str
     field: ColumnElement
     clause: Callable[[Operator, str, User | None], ColumnElement[bool]]
-    allowed_operators: list[Operator]
+    allowed_operators: tuple[Operator, ...]
     join: JoinInfo | None = None
     allow_sorting: bool = False
     requires_user: bool = False
@@ -68,12 +275,12 @@ class FilterableField:
     inferred_type: type = str
 
 
-@dataclass
+@dataclass(slots=True)
 class FilterMeta:
     """Metadata for a filterable field, encapsulating clause logic."""
 
     container_name: str | None = None
-    field: ColumnElement = None
+    field: ColumnElement | None = None
     exclude_operators: set[str] | None = None
     include_operators: set[str] | None = None
     join: JoinInfo | None = None
@@ -96,73 +303,48 @@ class FilterMeta:
         raise ValueError(f"Cannot extract field name from {type(attr)}")
 
     @staticmethod
-    def from_filter(filter_model: SQLModel) -> list[FilterableField]:
+    def from_filter(filter_model: type[BaseFilterModel]) -> list[FilterableField]:
         """Collect filterable fields from a filter model."""
-        fields: list[FilterableField] = []
-
-        # Get filter metadata from the model's get_filter_metadata method if available
-        filter_metadata_map: dict[str, FilterMeta] = {}
-        if hasattr(filter_model, "get_filter_metadata"):
-            filter_metadata_map = filter_model.get_filter_metadata()
-
-        for field_name, model_field in filter_model.model_fields.items():
-            # Try to get filter metadata from the classmethod
-            filter_meta = filter_metadata_map.get(field_name)
-
-            if not filter_meta:
-                continue
-
-            filterable_field = filter_meta.to_filterable_field(field_name, model_field)
-            if filterable_field:
-                fields.append(filterable_field)
-        return fields
+        return filter_model.filterable_fields()
 
     @staticmethod
+    @functools.cache
     def infer_type(annotation: type) -> tuple[type, str]:
-        """Infer the filter type from a field annotation."""
-        # Handle Union types (including Optional)
-        origin = get_origin(annotation)
-        if origin is not None:
-            args = get_args(annotation)
-            # Recursively check all types in the union, ignoring NoneType
-            for arg in args:
-                if arg is type(None):
-                    continue
-                return FilterMeta.infer_type(arg)
-            raise ValueError(f"Cannot infer filter type from annotation: {annotation}")
+        """Infer the filter type from a field annotation.
+
+        Plain annotations resolve through `_TYPE_DISPATCH`, results for unions and subclasses are memoized per annotation.
+        """
+        # Unwrap unions (including Optional) to their first non-None member in place,
+        # plain classes never have a typing origin so they skip get_origin()
+        while not isinstance(annotation, type) and get_origin(annotation) is not None:
+            annotation = next((arg for arg in get_args(annotation) if arg is not type(None)), None)
+        hit = _TYPE_DISPATCH.get(annotation)
+        if hit is not None:
+            return hit
         if isinstance(annotation, type):
             if issubclass(annotation, SQLModel):
                 return bool, "exists"
             if issubclass(annotation, enum.Enum) or issubclass(annotation, bool):
                 return annotation, "equals"
-            if issubclass(annotation, int | datetime):
+            if issubclass(annotation, (int, datetime)):
                 return annotation, "numeric"
-            if issubclass(annotation, str) or issubclass(annotation, EmailStr):
+            if issubclass(annotation, (str, EmailStr)):
                 return annotation, "contains"
-
-            if annotation == None.__class__:
-                return bool, "exists"
         raise ValueError(f"Cannot infer filter type from annotation: {annotation}")
 
-    def _allowed_operators(self, filter_type: str) -> list[Operator]:
-        """Return allowed operators for this filter type, minus any excluded."""
-        ops = set(OperatorMap.get(filter_type, set()))
-        if self.exclude_operators:
-            ops -= set(self.exclude_operators)
-        if self.include_operators:
-            ops |= set(self.include_operators)
-        return list(ops)
+    def _allowed_operators(self, filter_type: str) -> tuple[tuple[Operator, ...], frozenset[_OperatorTag]]:
+        """Return allowed operators and their tags for this filter type, minus any excluded."""
+        return _resolve_operators(
+            filter_type,
+            frozenset(self.exclude_operators or ()),
+            frozenset(self.include_operators or ()),
+        )
 
     def to_filterable_field(self, field_name: str, field_info: FieldInfo) -> FilterableField | None:
         """Get FilterableField instance for this filter metadata."""
         field_annotation = field_info.annotation
         inferred_type, filter_type = FilterMeta.infer_type(field_annotation)
-        allowed_operators = self._allowed_operators(filter_type)
-
-        def validate_clause(operator: Operator, value: str, user: User | None = None) -> ColumnElement[bool]:
-            if operator not in allowed_operators:
-                raise ValueError(f"Operator '{operator}' not allowed for field '{field_name}'. Allowed: {allowed_operators}")
-            return self._build_clause(operator, value, filter_type, inferred_type, user)
+        allowed_operators, allowed_tags = self._allowed_operators(filter_type)
 
         # Resolve exclude parameter
         exclude_field: str | None = None
@@ -175,7 +357,18 @@ class FilterMeta:
             name=field_name,
             field=self.field,
             join=self.join,
-            clause=validate_clause,
+            clause=_ClauseBuilder(
+                name=field_name,
+                field=self.field,
+                join=self.join,
+                condition=self.condition,
+                user_condition=self.user_condition,
+                allowed_operators=allowed_operators,
+                allowed_tags=allowed_tags,
+                inferred_type=inferred_type,
+                converters=_value_converters(inferred_type),
+                handlers=_OP_HANDLERS if self.join is None else _JOIN_OP_HANDLERS,
+            ),
             allowed_operators=allowed_operators,
             allow_sorting=self.allow_sorting,
             requires_user=self.user_condition is not None,
@@ -183,130 +376,105 @@ class FilterMeta:
             inferred_type=inferred_type,
         )
 
-    def _convert_value(  # noqa: C901
+
+@dataclass(slots=True, eq=False)
+class _ClauseBuilder:
+    """Validate an operator against a field and build its filter clause.
+
+    One instance is created per filterable field and used as its `clause` callable.
+    """
+
+    name: str
+    field: ColumnElement
+    join: JoinInfo | None
+    condition: ColumnElement[bool] | None
+    user_condition: Callable[[User | None], ColumnElement[bool]] | None
+    allowed_operators: tuple[Operator, ...]
+    allowed_tags: frozenset[_OperatorTag]
+    inferred_type: type
+    converters: tuple[Callable[[str], Any], ...]
+    handlers: tuple[Callable[[ColumnElement, Any], ColumnElement[bool]], ...]
+    # Static part of the EXISTS subquery of joined filters, built on first use
+    _exists_template: Select | None = dataclass_field(default=None, init=False)
+
+    def __call__(self, operator: Operator, value: str, user: User | None = None) -> ColumnElement[bool]:
+        """Build the clause for an operator and raw value, rejecting operators not allowed for the field."""
+        tag = _OP_TAG.get(operator)
+        if tag not in self.allowed_tags:
+            raise ValueError(f"Operator '{operator}' not allowed for field '{self.name}'. Allowed: {self.allowed_operators}")
+        return self._build_clause(tag, value, user)
+
+    def _convert_value(
         self,
         value: Any,  # noqa: ANN401
-        inferred_type: type,
-        operator: Operator,
+        tag: _OperatorTag,
     ) -> Any:  # noqa: ANN401
         """Convert value to the appropriate type based on inferred_type."""
         try:
-            if inferred_type is bool or operator == "exists":
-                return str(value).lower() in ("1", "true")
-            elif inferred_type is datetime:
-                return datetime.fromisoformat(value)
-            elif operator in ("in", "notin"):
-                # Parse value into a list
-                items: list[Any]
-                try:
-                    parsed = json.loads(value)
-                    if not isinstance(parsed, list):
-                        raise ValueError("Parsed JSON is not a list")
-                    items = parsed
-                except Exception as e:
-                    raise ValueError("Value for 'in'/'notin' operator must be a JSON array") from e
-
-                # Only support string and numeric inferred types
-                if inferred_type is str:
-                    converted: list[str] = []
-                    for elem in items:
-                        if isinstance(elem, (str, int, float)):
-                            converted.append(str(elem))
-                        else:
-                            raise ValueError(f"Invalid array element type: {type(elem)}")
-                    return converted
-                elif inferred_type in (int, float):
-                    converted: list[Any] = []
-                    for elem in items:
-                        if isinstance(elem, (int, float)):
-                            converted.append(inferred_type(elem))
-                        elif isinstance(elem, str):
-                            try:
-                                converted.append(inferred_type(elem))
-                            except Exception as exc:
-                                raise ValueError(f"Invalid numeric value '{elem}': {exc}") from exc
-                        else:
-                            raise ValueError(f"Invalid array element type: {type(elem)}")
-                    return converted
-                else:
-                    raise ValueError("Only string and numeric types supported for 'in'/'notin' operator")
-            else:
-                return inferred_type(value)
+            return self.converters[tag](value)
         except Exception as e:
-            raise ValueError(f"Invalid value '{value}' for type '{inferred_type.__name__}': {e}") from e
+            raise ValueError(f"Invalid value '{value}' for type '{self.inferred_type.__name__}': {e}") from e
 
-    def _get_base_where_clause(  # noqa: C901
+    def _bind_value(
         self,
-        operator: Operator,
+        tag: _OperatorTag,
         value: Any,  # noqa: ANN401
-    ) -> ColumnElement[bool]:
-        """Build base where clause for a given operator and value."""
-        if operator == "==":
-            return self.field == value
-        if operator == "!=" and self.join is None:
-            return (self.field != value) | (self.field == None)  # noqa: E711
-        if operator == "!=" and self.join is not None:
-            return self.field == value
-        if operator == "ilike":
-            return self.field.ilike(f"%{value}%")
-        if operator == "like":
-            return self.field.like(f"%{value}%")
-        if operator == ">=":
-            return self.field >= value
-        if operator == "<=":
-            return self.field <= value
-        if operator == ">":
-            return self.field > value
-        if operator == "<":
-            return self.field < value
-        if operator == "exists":
-            exists_flag = str(value).lower() in ("1", "true", "yes", "on")
-            return self.field != None if exists_flag else self.field == None  # noqa: E711
-        if operator == "in":
-            return self.field.in_(value)
-        if operator == "notin":
-            return ~self.field.in_(value)
-        raise ValueError(f"Unknown operator: {operator}")
+    ) -> BindParameter:
+        """Wrap a converted filter value in a named bind parameter.
+
+        Keeping every user supplied value in a typed bind parameter means the
+        statement structure only depends on the field and operator, so the
+        compiled SQL can be reused from SQLAlchemy's statement cache.
+        """
+        return bindparam(
+            f"filter_{self.name}",
+            value,
+            type_=self.field.type,
+            unique=True,
+            expanding=tag == _OperatorTag.IN or tag == _OperatorTag.NOTIN,
+        )
+
+    def _get_exists_template(self) -> Select:
+        """Return the correlated subquery selecting from the joined table, without any value dependent criteria.
+
+        Built lazily because the relationship's join condition is only available once the mappers are configured.
+        The template is shared between requests, each request only appends its own criteria to a copy of it.
+        """
+        if self._exists_template is None:
+            relationship = self.join.target.property
+            parent_col = relationship.primaryjoin.left
+            template = select(1).select_from(relationship.mapper.class_).where(parent_col == relationship.primaryjoin.right)
+            if self.condition is not None:
+                template = template.where(self.condition)
+            self._exists_template = template.correlate(parent_col.table)
+        return self._exists_template
 
     def _build_clause(
         self,
-        operator: Operator,
+        tag: _OperatorTag,
         value: object,
-        filter_type: str,
-        inferred_type: type,
         user: User | None = None,
     ) -> ColumnElement[bool]:
         """Return a SQLAlchemy clause based on the filter type and value."""
-        converted_value = self._convert_value(value, inferred_type, operator)
-        base_where_clause = self._get_base_where_clause(operator, converted_value)
+        converted_value = self._convert_value(value, tag)
+        if tag != _OperatorTag.EXISTS:
+            converted_value = self._bind_value(tag, converted_value)
+        parts: list[ColumnElement[bool]] = [self.handlers[tag](self.field, converted_value)]
+        if self.user_condition and user:
+            parts.append(self.user_condition(user))
 
         if self.join:
-            rel_attr: InstrumentedAttribute = self.join.target
-            target_mapper = rel_attr.property.mapper.class_
-            parent_col = rel_attr.property.primaryjoin.left
+            # The prebuilt template already holds the static criteria, a single
+            # where() call AND-s the value dependent ones onto a copy of it
+            clause = exists(self._get_exists_template().where(*parts))
+            return ~clause if tag == _OperatorTag.NE else clause
+        return parts[0] if len(parts) == 1 else and_(*parts)
 
-            where_clause = base_where_clause
 
-            if self.condition is not None:
-                where_clause = and_(where_clause, self.condition)
-
-            if self.user_condition and user:
-                user_clause = self.user_condition(user)
-                where_clause = and_(where_clause, user_clause)
-
-            clause = exists(
-                select(1)
-                .select_from(target_mapper)
-                .where(where_clause)
-                .where(parent_col == rel_attr.property.primaryjoin.right)
-                .correlate(parent_col.table)
-            )
-            return ~clause if operator == "!=" else clause
-        else:
-            if self.user_condition and user:
-                user_clause = self.user_condition(user)
-                return and_(base_where_clause, user_clause)
-            return base_where_clause
+def precompute_filters() -> None:
+    """Build and cache the filterable fields of every registered filter model."""
+    for filter_model in _FILTER_MODELS:
+        filter_model.filterable_fields()
 
 
 # ================================================================
@@ -321,19 +489,16 @@ class GroupFilter(BaseFilterModel):
     member_count: int = Field()
     accepted: bool = Field()
 
-    @classmethod
-    def get_filter_metadata(cls) -> dict[str, FilterMeta]:
-        """Return filter metadata for GroupFilter fields."""
-        return {
-            "name": FilterMeta(field=Group.name),
-            "member_count": FilterMeta(field=Group.member_count),
-            "accepted": FilterMeta(
-                field=Membership.accepted,
-                join=JoinInfo(target=Group.memberships),
-                user_condition=lambda user: Membership.user_id == user.id if user else None,
-                exclude=True,
-            ),
-        }
+    _FILTER_METADATA: ClassVar[dict[str, FilterMeta]] = {
+        "name": FilterMeta(field=Group.name),
+        "member_count": FilterMeta(field=Group.member_count),
+        "accepted": FilterMeta(
+            field=Membership.accepted,
+            join=JoinInfo(target=Group.memberships),
+            user_condition=lambda user: Membership.user_id == user.id if user else None,
+            exclude=True,
+        ),
+    }
 
 
 # ================================================================
@@ -347,15 +512,12 @@ class DocumentFilter(BaseFilterModel):
     order: int = Field()
     created_at: datetime = Field()
 
-    @classmethod
-    def get_filter_metadata(cls) -> dict[str, FilterMeta]:
-        """Return filter metadata for DocumentFilter fields."""
-        return {
-            "size_bytes": FilterMeta(field=Document.size_bytes),
-            "group_id": FilterMeta(field=Document.group_id, exclude=Document.group),
-            "order": FilterMeta(field=Document.order, allow_sorting=True),
-            "created_at": FilterMeta(field=Document.created_at, allow_sorting=True),
-        }
+    _FILTER_METADATA: ClassVar[dict[str, FilterMeta]] = {
+        "size_bytes": FilterMeta(field=Document.size_bytes),
+        "group_id": FilterMeta(field=Document.group_id, exclude=Document.group),
+        "order": FilterMeta(field=Document.order, allow_sorting=True),
+        "created_at": FilterMeta(field=Document.created_at, allow_sorting=True),
+    }
 
 
 # ================================================================
@@ -369,15 +531,12 @@ class MembershipFilter(BaseFilterModel):
     accepted: bool = Field()
     sharelink_id: str = Field()
 
-    @classmethod
-    def get_filter_metadata(cls) -> dict[str, FilterMeta]:
-        """Return filter metadata for MembershipFilter fields."""
-        return {
-            "user_id": FilterMeta(field=Membership.user_id, exclude=Membership.user),
-            "group_id": FilterMeta(field=Membership.group_id, exclude=Membership.group),
-            "accepted": FilterMeta(field=Membership.accepted),
-            "sharelink_id": FilterMeta(field=Membership.sharelink_id, exclude=Membership.share_link),
-        }
+    _FILTER_METADATA: ClassVar[dict[str, FilterMeta]] = {
+        "user_id": FilterMeta(field=Membership.user_id, exclude=Membership.user),
+        "group_id": FilterMeta(field=Membership.group_id, exclude=Membership.group),
+        "accepted": FilterMeta(field=Membership.accepted),
+        "sharelink_id": FilterMeta(field=Membership.sharelink_id, exclude=Membership.share_link),
+    }
 
 
 # ================================================================
@@ -393,24 +552,21 @@ class CommentFilter(BaseFilterModel):
     annotation: dict = Field()
     id: int = Field()
 
-    @classmethod
-    def get_filter_metadata(cls) -> dict[str, FilterMeta]:
-        """Return filter metadata for Comment fields."""
-        return {
-            "visibility": FilterMeta(field=Comment.visibility),
-            "user_id": FilterMeta(field=Comment.user_id, exclude=Comment.user),
-            "document_id": FilterMeta(field=Comment.document_id, exclude=Comment.document),
-            "parent_id": FilterMeta(
-                field=Comment.parent_id,
-                exclude=Comment.parent,
-                include_operators={"exists"},
-            ),
-            "has_annotations": FilterMeta(
-                field=Comment.annotation,
-                include_operators={"exists"},
-            ),
-            "id": FilterMeta(field=Comment.id),
-        }
+    _FILTER_METADATA: ClassVar[dict[str, FilterMeta]] = {
+        "visibility": FilterMeta(field=Comment.visibility),
+        "user_id": FilterMeta(field=Comment.user_id, exclude=Comment.user),
+        "document_id": FilterMeta(field=Comment.document_id, exclude=Comment.document),
+        "parent_id": FilterMeta(
+            field=Comment.parent_id,
+            exclude=Comment.parent,
+            include_operators={"exists"},
+        ),
+        "has_annotations": FilterMeta(
+            field=Comment.annotation,
+            include_operators={"exists"},
+        ),
+        "id": FilterMeta(field=Comment.id),
+    }
 
 
 # ================================================================
@@ -424,18 +580,15 @@ class UserFilter(BaseFilterModel):
     last_name: str = Field()
     group_id: str = Field()
 
-    @classmethod
-    def get_filter_metadata(cls) -> dict[str, FilterMeta]:
-        """Return filter metadata for UserFilter fields."""
-        return {
-            "username": FilterMeta(field=User.username),
-            "first_name": FilterMeta(field=User.first_name),
-            "last_name": FilterMeta(field=User.last_name),
-            "group_id": FilterMeta(
-                field=Membership.group_id,
-                join=JoinInfo(target=User.memberships),
-            ),
-        }
+    _FILTER_METADATA: ClassVar[dict[str, FilterMeta]] = {
+        "username": FilterMeta(field=User.username),
+        "first_name": FilterMeta(field=User.first_name),
+        "last_name": FilterMeta(field=User.last_name),
+        "group_id": FilterMeta(
+            field=Membership.group_id,
+            join=JoinInfo(target=User.memberships),
+        ),
+    }
 
 
 # ================================================================
@@ -448,11 +601,8 @@ class ShareLinkFilter(BaseFilterModel):
     expires_at: datetime = Field()
     author_id: int = Field()
 
-    @classmethod
-    def get_filter_metadata(cls) -> dict[str, FilterMeta]:
-        """Return filter metadata for ShareLinkFilter fields."""
-        return {
-            "label": FilterMeta(field=ShareLink.label),
-            "expires_at": FilterMeta(field=ShareLink.expires_at),
-            "author_id": FilterMeta(field=ShareLink.author_id, exclude=ShareLink.author),
-        }
+    _FILTER_METADATA: ClassVar[dict[str, FilterMeta]] = {
+        "label": FilterMeta(field=ShareLink.label),
+        "expires_at": FilterMeta(field=ShareLink.expires_at),
+        "author_id": FilterMeta(field=ShareLink.author_id, exclude=ShareLink.author),
+    }
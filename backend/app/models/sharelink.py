@@ -1,7 +1,7 @@
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Self
 
-from pydantic import field_validator
+from pydantic import ConfigDict, field_validator
 from sqlmodel import Field, SQLModel
 
 from models.enums import Permission
@@ -23,6 +23,12 @@ def _validate_tz_aware(
     return v
 
 
+def _construct[M: SQLModel](model: type[M], obj: Any, **overrides: Any) -> M:  # noqa: ANN401
+    """Build `model` from the attributes of a trusted ORM object without running validation."""
+    data = {name: overrides[name] if name in overrides else getattr(obj, name) for name in model.model_fields}
+    return model.model_construct(_fields_set=set(data), **data)
+
+
 # =========================
 
 
@@ -38,13 +44,41 @@ class ShareLinkCreate(SQLModel):
 
 
 class ShareLinkReadBase(SQLModel):
+    # Read models are only built from database rows and never mutated afterwards
+    model_config = ConfigDict(frozen=True)
+
     id: int
-    permissions: set[Permission]
+    permissions: frozenset[Permission]
     expires_at: datetime | None = None
     allow_anonymous_access: bool
     created_at: datetime
     updated_at: datetime
 
+    @classmethod
+    def from_orm_trusted(cls, obj: Any, **overrides: Any) -> Self:  # noqa: ANN401
+        """Build the read model from a share link loaded from the database, skipping validation.
+
+        Only use this for database rows, API input must still go through `model_validate`.
+        Values already known to the caller can be passed as overrides, the related `author`
+        may be passed as the ORM row since it is not loaded with the share link.
+        """
+        from models.group import GroupRead
+        from models.user import UserRead
+
+        overrides.setdefault("permissions", frozenset(obj.permissions))
+        if "author" in cls.model_fields:
+            author = overrides["author"] if "author" in overrides else obj.author
+            overrides["author"] = _construct(UserRead, author) if author else None
+        if "group" in cls.model_fields and "group" not in overrides:
+            group = obj.group
+            overrides["group"] = _construct(
+                GroupRead,
+                group,
+                owner=_construct(UserRead, group.owner) if group.owner else None,
+                default_permissions=[Permission(p) for p in group.default_permissions],
+            )
+        return _construct(cls, obj, **overrides)
+
 
 class ShareLinkRead(ShareLinkReadBase):
     label: str | None = None
@@ -1,18 +1,28 @@
 import secrets
-from datetime import UTC, datetime
+from datetime import datetime
 from typing import ClassVar, Optional
-from uuid import UUID, uuid4
-
-from nanoid import generate
-from sqlalchemy import Boolean, Column, DateTime, String, UniqueConstraint
-from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from uuid import UUID
+
+from core.clock import now
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.orm import aliased, column_property
+from sqlalchemy.orm import column_property, load_only, undefer
 from sqlalchemy.sql.elements import ColumnElement
 from sqlmodel import Field, Relationship, func, select
 
 from models.base import BaseModel
+from models.column_types import PermissionMask
 from models.enums import (
     AnswerType,
     DocumentVisibility,
@@ -23,6 +33,15 @@ from models.enums import (
     Visibility,
 )
 
+# Share link tokens carry 128 bits of entropy, they are the only secret guarding group access
+SHARE_LINK_TOKEN_BYTES = 16
+
+
+def generate_share_link_token() -> str:
+    """Generate a url-safe share link token straight from the OS entropy pool."""
+    return secrets.token_urlsafe(SHARE_LINK_TOKEN_BYTES)
+
+
 # TABLES
 
 
@@ -38,12 +57,17 @@ class User(BaseModel, table=True):
     is_guest: bool = Field(default=False, sa_column=Column(Boolean, server_default="false"))
     # For personally signed URLs, JWT encryption etc.
     secret: str = Field(
-        default_factory=func.gen_random_uuid,
-        sa_column=Column(String, server_default=func.gen_random_uuid()),
+        default=None,
+        sa_column=Column(String, nullable=False, server_default=func.gen_random_uuid()),
     )
 
-    memberships: list["Membership"] = Relationship(back_populates="user", sa_relationship_kwargs={"lazy": "noload"})
-    comments: list["Comment"] = Relationship(back_populates="user", sa_relationship_kwargs={"lazy": "noload"})
+    # Never loaded implicitly, so deleting a user leaves these rows to the ON DELETE rules of their foreign keys
+    memberships: list["Membership"] = Relationship(
+        back_populates="user", sa_relationship_kwargs={"lazy": "raise_on_sql", "passive_deletes": "all"}
+    )
+    comments: list["Comment"] = Relationship(
+        back_populates="user", sa_relationship_kwargs={"lazy": "raise_on_sql", "passive_deletes": "all"}
+    )
     groups: list["Group"] = Relationship(
         back_populates=None,
         sa_relationship_kwargs={
@@ -54,26 +78,45 @@ class User(BaseModel, table=True):
             "lazy": "noload",
         },
     )
-    reactions: list["Reaction"] = Relationship(back_populates="user", sa_relationship_kwargs={"lazy": "noload"})
-    share_links: list["ShareLink"] = Relationship(back_populates="author", sa_relationship_kwargs={"lazy": "noload"})
+    reactions: list["Reaction"] = Relationship(
+        back_populates="user", sa_relationship_kwargs={"lazy": "raise_on_sql", "passive_deletes": "all"}
+    )
+    share_links: list["ShareLink"] = Relationship(
+        back_populates="author", sa_relationship_kwargs={"lazy": "raise_on_sql", "passive_deletes": "all"}
+    )
 
     def rotate_secret(self) -> None:
-        """Rotate the user secret to invalidate existing tokens."""
-        self.secret = str(uuid4())
+        """Rotate the user secret to invalidate existing tokens.
+
+        The new secret is generated by the database in the flushed UPDATE, so `secret` stays expired afterwards.
+        Callers must refresh the instance before reading it, in async code a lazy reload raises MissingGreenlet.
+        """
+        self.secret = func.gen_random_uuid()  # type: ignore[assignment]
 
 
 class Membership(BaseModel, table=True):
     """Association table for user-group relationships with permissions."""
 
+    # Backs the Group._owners lookup. Not unique: ownership transfers flag the new owner before the old one is cleared
+    __table_args__ = (
+        Index(
+            "ix_membership_group_owner",
+            "group_id",
+            "created_at",
+            postgresql_where=text("is_owner"),
+        ),
+    )
+
     user_id: int = Field(foreign_key="user.id", ondelete="CASCADE", primary_key=True)
     group_id: str = Field(foreign_key="group.id", ondelete="CASCADE", primary_key=True)
-    permissions: list[Permission] = Field(default_factory=list, sa_column=Column(ARRAY(String)))
+    permissions: list[Permission] = Field(default_factory=list, sa_column=Column(PermissionMask, nullable=False, server_default="0"))
     is_owner: bool = Field(default=False)
     sharelink_id: int | None = Field(
         foreign_key="sharelink.id",
         nullable=True,
         default=None,
         ondelete="SET NULL",
+        index=True,
     )
     accepted: bool = Field(default=False)
     user: User = Relationship(
@@ -110,7 +153,8 @@ class Membership(BaseModel, table=True):
 class Document(BaseModel, table=True):
     """Document entity representing uploaded files."""
 
-    id: str = Field(default_factory=lambda: generate(size=10), primary_key=True, index=True)
+    # 10 character nanoid, generated by the nanoid10() SQL function
+    id: str = Field(default=None, sa_column=Column(String, primary_key=True, server_default=text("nanoid10()")))
     name: str = Field()
     description: str | None = Field(nullable=True, default=None)
     storage_key: str = Field(index=True, unique=True)
@@ -133,7 +177,7 @@ class Document(BaseModel, table=True):
     comments: list["Comment"] = Relationship(
         back_populates="document",
         sa_relationship_kwargs={
-            "lazy": "noload",
+            "lazy": "raise_on_sql",
             "cascade": "all, delete-orphan",
             "passive_deletes": True,
         },
@@ -162,12 +206,18 @@ class Document(BaseModel, table=True):
 class Group(BaseModel, table=True):
     """Group entity for shared document management."""
 
-    id: str = Field(default_factory=lambda: generate(size=10), primary_key=True, index=True)
+    # 10 character nanoid, generated by the nanoid10() SQL function
+    id: str = Field(default=None, sa_column=Column(String, primary_key=True, server_default=text("nanoid10()")))
     name: str = Field(index=True, unique=True)
     # For group signed URLs, JWT encryption etc.
-    secret: str = Field(default_factory=func.gen_random_uuid)
-    default_permissions: list[Permission] = Field(default_factory=list, sa_column=Column(ARRAY(String)))
-    member_count: ClassVar[int]
+    secret: str = Field(
+        default=None,
+        sa_column=Column(String, nullable=False, server_default=func.gen_random_uuid()),
+    )
+    default_permissions: list[Permission] = Field(default_factory=list, sa_column=Column(PermissionMask, nullable=False, server_default="0"))
+    # Number of memberships in this group, kept in sync by the
+    # membership_group_count trigger on the membership table
+    member_count: int = Field(default=0, sa_column=Column(Integer, nullable=False, server_default="0"))
     document_count: ClassVar[int]
 
     _owners: list["User"] = Relationship(
@@ -190,7 +240,7 @@ class Group(BaseModel, table=True):
     documents: list["Document"] = Relationship(
         back_populates="group",
         sa_relationship_kwargs={
-            "lazy": "noload",
+            "lazy": "raise_on_sql",
             "cascade": "all, delete-orphan",
             "passive_deletes": True,
         },
@@ -206,24 +256,20 @@ class Group(BaseModel, table=True):
     share_links: list["ShareLink"] = Relationship(
         back_populates="group",
         sa_relationship_kwargs={
-            "lazy": "noload",
+            "lazy": "raise_on_sql",
             "cascade": "all, delete-orphan",
             "passive_deletes": True,
         },
     )
 
-    def rotate_secret(self) -> None:
-        """Rotate the group secret to invalidate existing tokens."""
-        self.secret = str(uuid4())
-
 
 # Define count column properties after class creation so Group is a fully
 # mapped class and can be passed to correlate() directly.
-Group.member_count = column_property(
-    select(func.count(Membership.user_id)).where(Membership.group_id == Group.id).correlate(Group).scalar_subquery()
-)
+# Deferred, the correlated subquery only runs where a query asks for it via GROUP_COUNT_OPTIONS.
 Group.document_count = column_property(
-    select(func.count(Document.id)).where(Document.group_id == Group.id).correlate(Group).scalar_subquery()
+    select(func.count()).select_from(Document).where(Document.group_id == Group.id).correlate(Group).scalar_subquery(),
+    deferred=True,
+    raiseload=True,
 )
 
 
@@ -269,6 +315,15 @@ class GroupReaction(BaseModel, table=True):
 class Comment(BaseModel, table=True):
     """Comment entity for annotations and discussions."""
 
+    # Lets Document.root_comment_count count top-level comments with an index-only scan
+    __table_args__ = (
+        Index(
+            "ix_comment_document_root",
+            "document_id",
+            postgresql_where=text("parent_id IS NULL"),
+        ),
+    )
+
     id: int = Field(default=None, primary_key=True)
     visibility: Visibility = Field()
     document_id: str = Field(foreign_key="document.id", ondelete="CASCADE", index=True)
@@ -285,17 +340,19 @@ class Comment(BaseModel, table=True):
 
     document: Document = Relationship(back_populates="comments", sa_relationship_kwargs={"lazy": "selectin"})
     user: User | None = Relationship(back_populates="comments", sa_relationship_kwargs={"lazy": "selectin"})
+    # Not eager loaded: selectin here walked every reply's ancestor chain one query per depth level,
+    # and responses only expose parent_id
     parent: Optional["Comment"] = Relationship(
         back_populates="replies",
         sa_relationship_kwargs={
             "remote_side": "Comment.id",
-            "lazy": "selectin",
+            "lazy": "raise_on_sql",
         },
     )
     replies: list["Comment"] = Relationship(
         back_populates="parent",
         sa_relationship_kwargs={
-            "lazy": "noload",
+            "lazy": "raise_on_sql",
             "cascade": "all, delete-orphan",
             "passive_deletes": True,
         },
@@ -326,7 +383,8 @@ class Comment(BaseModel, table=True):
         },
     )
 
-    num_replies: ClassVar[int]
+    # Number of direct replies, kept in sync by the comment_reply_count trigger on the comment table
+    num_replies: int = Field(default=0, sa_column=Column(Integer, nullable=False, server_default="0"))
 
 
 class Reaction(BaseModel, table=True):
@@ -462,15 +520,25 @@ class TaskResponse(BaseModel, table=True):
 class ShareLink(BaseModel, table=True):
     """A link granting access to a group with specified permissions."""
 
+    # Token lookups only read these columns, covering them lets Postgres answer from the index alone
+    __table_args__ = (
+        Index(
+            "ix_sharelink_token_cover",
+            "token",
+            unique=True,
+            postgresql_include=["group_id", "expires_at", "permissions", "allow_anonymous_access"],
+        ),
+    )
+
     id: int = Field(default=None, primary_key=True)
-    group_id: str = Field(foreign_key="group.id", ondelete="CASCADE")
+    group_id: str = Field(foreign_key="group.id", ondelete="CASCADE", index=True)
     author_id: int | None = Field(foreign_key="user.id", ondelete="SET NULL", nullable=True)
-    permissions: list[Permission] = Field(default_factory=list, sa_column=Column(ARRAY(String)))
+    permissions: list[Permission] = Field(default_factory=list, sa_column=Column(PermissionMask, nullable=False, server_default="0"))
     allow_anonymous_access: bool = Field(default=False, sa_column=Column(Boolean, server_default="false"))
 
     token: str = Field(
-        default_factory=lambda: secrets.token_urlsafe(16),
-        sa_column=Column(String, unique=True, index=True),
+        default_factory=generate_share_link_token,
+        sa_column=Column(String),
     )
 
     expires_at: datetime | None = Field(
@@ -485,9 +553,10 @@ class ShareLink(BaseModel, table=True):
         back_populates="share_links",
         sa_relationship_kwargs={"lazy": "selectin"},
     )
+    # Not loaded by default, the share link routes batch-load authors only where they are serialized
     author: Optional["User"] = Relationship(
         back_populates="share_links",
-        sa_relationship_kwargs={"lazy": "selectin"},
+        sa_relationship_kwargs={"lazy": "noload"},
     )
 
     is_expired: ClassVar[bool]
@@ -497,7 +566,7 @@ class ShareLink(BaseModel, table=True):
         """Return whether the share link is currently valid (Python-side)."""
         if self.expires_at is None:
             return False  # If no expiry date, the link is not expired
-        return datetime.now(UTC) > self.expires_at
+        return now() > self.expires_at
 
     @is_expired.expression
     def is_expired(cls) -> ColumnElement[bool]:
@@ -507,43 +576,35 @@ class ShareLink(BaseModel, table=True):
     # ! WARNING this cascade delete will not handle sharelink expiry,
     # ! WARNING additional checks need to be made in an group guard to validate if the user link is expired
     # ! WARNING but this check is also required to not leave orphaned memberships
+    # Not loaded by default, use selectinload(ShareLink.memberships) where the rows themselves are needed.
+    # Since it is never loaded, the cascade does not reach these rows: delete_share_link removes them explicitly.
     memberships: list["Membership"] = Relationship(
         back_populates="share_link",
         sa_relationship_kwargs={
-            "lazy": "selectin",
+            "lazy": "noload",
             "cascade": "all, delete-orphan",
             "passive_deletes": True,
         },
     )
 
-    num_memberships: ClassVar[int]
-
-    @hybrid_property
-    def num_memberships(self) -> int:
-        """Return the number of memberships created via this share link (Python-side)."""
-        # Use the relationship to provide a Python-side count when memberships
-        # are loaded; this avoids referencing the mapped class during mapping.
-        return len(self.memberships or [])
-
-    @num_memberships.expression
-    def num_memberships(cls) -> select:
-        """Return SQL expression returning number of memberships created via this share link."""
-        # Now that the class is mapped, reference Membership to build a
-        # DB-level expression used in queries.
-        return select(func.count(Membership.user_id)).where(Membership.sharelink_id == cls.id).correlate(ShareLink).scalar_subquery()
+    # Number of memberships created via this share link, kept in sync by the
+    # membership_sharelink_count trigger on the membership table
+    num_memberships: int = Field(default=0, sa_column=Column(Integer, nullable=False, server_default="0"))
 
     def rotate_token(self) -> None:
         """Invalidate this share link by rotating its token."""
-        self.token = secrets.token_urlsafe(16)
+        self.token = generate_share_link_token()
 
 
 # Document aggregate column properties (defined here because Task and
-# Comment are declared after Document).
+# Comment are declared after Document). count(*) needs no column values,
+# so each subquery can be answered from the document_id indexes alone.
 Document.task_count = column_property(
-    select(func.count(Task.id)).where(Task.document_id == Document.id).correlate(Document).scalar_subquery()
+    select(func.count()).select_from(Task).where(Task.document_id == Document.id).correlate(Document).scalar_subquery()
 )
 Document.root_comment_count = column_property(
-    select(func.count(Comment.id))
+    select(func.count())
+    .select_from(Comment)
     .where(
         Comment.document_id == Document.id,
         Comment.parent_id.is_(None),  # type: ignore[union-attr]
@@ -552,9 +613,19 @@ Document.root_comment_count = column_property(
     .scalar_subquery()
 )
 
-# Define num_replies column property after class creation to allow aliasing
-# We need to use an alias for the inner query to distinguish it from the outer row
-_CommentAlias = aliased(Comment)
-Comment.num_replies = column_property(
-    select(func.count(_CommentAlias.id)).where(_CommentAlias.parent_id == Comment.id).correlate(Comment).scalar_subquery()
+# Loader options for queries that serialize GroupRead (built last, undefer() configures the mappers)
+GROUP_COUNT_OPTIONS = (undefer(Group.document_count),)
+
+# Loader options for queries that only serialize UserRead, leaving password, secret and email unloaded
+USER_READ_OPTIONS = (
+    load_only(
+        User.id,
+        User.username,
+        User.first_name,
+        User.last_name,
+        User.is_guest,
+        User.created_at,
+        User.updated_at,
+        raiseload=True,
+    ),
 )
@@ -1,8 +1,26 @@
-from pydantic import field_validator
+import string
+
+from pydantic import ConfigDict, field_validator
 from sqlmodel import Field, SQLModel
 
 from models.base import BaseModel
 
+_HEX_DIGITS = frozenset(string.hexdigits)
+
+
+def _validate_color(v: str | None) -> str | None:
+    """Validate that color is a #RRGGBB hex code and normalize it to upper case."""
+    if v is None:
+        return None
+    if not v.startswith("#"):
+        raise ValueError("Color must start with #")
+    if len(v) != 7:
+        raise ValueError("Color must be in format #RRGGBB")
+    # Set lookup instead of int(v, 16), which also accepts "_", "+", whitespace and non-ASCII digits
+    if not _HEX_DIGITS.issuperset(v[1:]):
+        raise ValueError("Color must be a valid hex code")
+    return v.upper()
+
 
 class TagCreate(SQLModel):
     """Model for creating a new tag."""
@@ -11,19 +29,7 @@ class TagCreate(SQLModel):
     description: str | None = Field(default=None, max_length=200)
     color: str = Field(max_length=7)
 
-    @field_validator("color")
-    @classmethod
-    def validate_color(cls, v: str) -> str:
-        """Validate that color is a valid hex code."""
-        if not v.startswith("#"):
-            raise ValueError("Color must start with #")
-        if len(v) != 7:
-            raise ValueError("Color must be in format #RRGGBB")
-        try:
-            int(v[1:], 16)
-        except ValueError as e:
-            raise ValueError("Color must be a valid hex code") from e
-        return v.upper()
+    _validate_color = field_validator("color")(_validate_color)
 
 
 class TagUpdate(SQLModel):
@@ -33,26 +39,15 @@ class TagUpdate(SQLModel):
     description: str | None = Field(default=None, max_length=200)
     color: str | None = Field(default=None, max_length=7)
 
-    @field_validator("color")
-    @classmethod
-    def validate_color(cls, v: str | None) -> str | None:
-        """Validate that color is a valid hex code."""
-        if v is None:
-            return None
-        if not v.startswith("#"):
-            raise ValueError("Color must start with #")
-        if len(v) != 7:
-            raise ValueError("Color must be in format #RRGGBB")
-        try:
-            int(v[1:], 16)
-        except ValueError as e:
-            raise ValueError("Color must be a valid hex code") from e
-        return v.upper()
+    _validate_color = field_validator("color")(_validate_color)
 
 
 class TagRead(BaseModel):
     """Model for reading tag data."""
 
+    # Read models are only built from database rows and never mutated afterwards
+    model_config = ConfigDict(frozen=True)
+
     id: int
     document_id: str
     label: str
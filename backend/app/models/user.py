@@ -5,6 +5,7 @@ from pydantic import (
     BaseModel as PydanticBaseModel,
 )
 from pydantic import (
+    ConfigDict,
     EmailStr,
     field_validator,
 )
@@ -83,6 +84,9 @@ class UserCreate(SQLModel):
 
 
 class UserRead(BaseModel):
+    # Read models are only built from database rows and never mutated afterwards
+    model_config = ConfigDict(frozen=True)
+
     id: int
     username: str
     first_name: str | None = None
@@ -5,12 +5,13 @@
 
 # ! The source was heavily modified in order to allow different methods on the same path with and without a trailing slash.
 
-# To avoid any future issues the FastAPIRouter has been extended to automatically duplicate all routes with and without a trailing slash per the issue above.
+# To avoid any future issues the FastAPIRouter has been extended to register every route without a trailing slash,
+# and StripTrailingSlashMiddleware removes the trailing slash from incoming request paths before routing.
 # Eventually this workaround can be removed as there is already an approved pull request on the fastapi repo (https://github.com/fastapi/fastapi/pull/12145) that will fix this with a single flag
 # `app = FastAPI(ignore_trailing_slash=True)`.
 # ! USE THIS INSTEAD OF FASTAPIROUTER WHEN ADDING NEW ROUTERS TO THE APP
 
-# ! WARNING: Using this creates N*2 duplicate routes for each route where N is the route depth, I don't know how much of a performance impact this is but it seems to be negligible.
+# ! The route table stays at one entry per route (duplicating them made Starlette's linear route matching walk twice as many routes per nesting level)
 # ! The main benefit is that clients can use both versions of the route without any issues due to redirects
 
 from collections.abc import Callable
@@ -18,10 +19,11 @@ from typing import Any
 
 from fastapi import APIRouter as FastAPIRouter
 from fastapi.types import DecoratedCallable
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 
 class APIRouter(FastAPIRouter):
-    """A custom router that automatically registers routes with and without a trailing slash."""
+    """A custom router that registers routes without a trailing slash, see StripTrailingSlashMiddleware."""
 
     def add_api_route(
         self,
@@ -31,10 +33,27 @@ class APIRouter(FastAPIRouter):
         include_in_schema: bool = True,
         **kwargs: dict[str, Any],
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
-        """Register a new route with and without a trailing slash."""
+        """Register a new route without a trailing slash."""
         if path.endswith("/"):
             path = path[:-1]
 
-        # Register both versions of the route
         super().add_api_route(path, endpoint, include_in_schema=include_in_schema, **kwargs)
-        super().add_api_route(path + "/", endpoint, include_in_schema=False, **kwargs)
+
+
+class StripTrailingSlashMiddleware:
+    """ASGI middleware that strips the trailing slash from HTTP request paths so they match the routes registered by APIRouter."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap the ASGI app."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Rewrite the path of HTTP requests ending in a slash (except the root) before routing."""
+        if scope["type"] == "http":
+            path: str = scope["path"]
+            if path != "/" and path.endswith("/"):
+                scope = {**scope, "path": path.rstrip("/") or "/"}
+                raw_path: bytes | None = scope.get("raw_path")
+                if raw_path is not None:
+                    scope["raw_path"] = raw_path.rstrip(b"/") or b"/"
+        await self.app(scope, receive, send)
@@ -1,11 +1,11 @@
 """Redis-based cache utility for expensive query results."""
 
-import json
 from functools import lru_cache
 from typing import Any
 from urllib.parse import quote
 
 import core.config as cfg
+import orjson
 import redis.asyncio as redis
 from core.logger import get_logger
 
@@ -13,6 +13,12 @@ cache_logger = get_logger("cache")
 
 # Default TTL for cached score data (in seconds)
 SCORE_CACHE_TTL = 300  # 5 minutes
+# COUNT hint for SCAN during invalidation
+SCAN_BATCH_SIZE = 1000
+# Seconds a request waits for a free pooled connection before the cache call fails (and is treated as a miss)
+POOL_TIMEOUT = 1
+# Idle seconds after which a pooled connection is PINGed before reuse
+HEALTH_CHECK_INTERVAL = 30
 
 
 def _build_redis_url() -> str:
@@ -23,11 +29,22 @@ def _build_redis_url() -> str:
 
 @lru_cache(maxsize=1)
 def _get_redis() -> redis.Redis:
-    """Return a singleton async Redis client for caching."""
-    return redis.from_url(
+    """Return a singleton async Redis client for caching.
+
+    Responses are left as bytes, cached payloads go straight to orjson without a str decode.
+    The pool is capped so bursts wait briefly for a connection instead of opening unbounded sockets,
+    and idle connections are health checked so a dropped socket is replaced rather than failing a request.
+    """
+    pool = redis.BlockingConnectionPool.from_url(
         _build_redis_url(),
-        decode_responses=True,
+        max_connections=cfg.REDIS_CACHE_MAX_CONNECTIONS,
+        timeout=POOL_TIMEOUT,
+        health_check_interval=HEALTH_CHECK_INTERVAL,
+        socket_keepalive=True,
+        client_name="text-ur-cache",
     )
+    # from_pool hands the pool to the client so aclose() on shutdown disconnects it too
+    return redis.Redis.from_pool(pool)
 
 
 async def get_cached(key: str) -> dict[str, Any] | None:
@@ -39,7 +56,7 @@ async def get_cached(key: str) -> dict[str, Any] | None:
     try:
         raw = await r.get(key)
         if raw is not None:
-            return json.loads(raw)
+            return orjson.loads(raw)
     except Exception as e:
         cache_logger.warning("Cache read error for %s: %s", key, e)
     return None
@@ -53,28 +70,36 @@ async def set_cached(
     """Store a value in cache with TTL (seconds)."""
     r = _get_redis()
     try:
-        await r.set(key, json.dumps(value), ex=ttl)
+        await r.set(key, orjson.dumps(value), ex=ttl)
     except Exception as e:
         cache_logger.warning("Cache write error for %s: %s", key, e)
 
 
+async def _unlink_matching(r: redis.Redis, pattern: str, *keys: str) -> None:
+    """Unlink *keys* and every key matching *pattern*.
+
+    SCAN pages are queued on a non-transactional pipeline and sent with a
+    single round trip at the end. UNLINK frees the values in a background
+    thread instead of blocking Redis like DELETE.
+    """
+    async with r.pipeline(transaction=False) as pipe:
+        if keys:
+            pipe.unlink(*keys)
+        async for key in r.scan_iter(match=pattern, count=SCAN_BATCH_SIZE):
+            pipe.unlink(key)
+        await pipe.execute()
+
+
 async def invalidate_group_scores(group_id: str) -> None:
     """Delete all cached scores for a group.
 
-    Uses SCAN + DELETE to remove keys matching
+    Uses SCAN + UNLINK to remove keys matching
     ``score:{group_id}:*``.  Called when score config or
     group reactions change.
     """
-    r = _get_redis()
     pattern = f"score:{group_id}:*"
     try:
-        cursor: int | str = 0
-        while True:
-            cursor, keys = await r.scan(cursor=cursor, match=pattern, count=200)
-            if keys:
-                await r.delete(*keys)
-            if int(cursor) == 0:
-                break
+        await _unlink_matching(_get_redis(), pattern)
     except Exception as e:
         cache_logger.warning("Cache invalidation error for %s: %s", pattern, e)
 
@@ -90,21 +115,10 @@ async def invalidate_user_score(
     Prefer this over :func:`invalidate_group_scores` when only one
     user's score has changed (e.g. task response submission).
     """
-    r = _get_redis()
-    base_key = f"score:{group_id}:{user_id}"
+    base_key = score_cache_key(group_id, user_id)
     try:
-        # Always delete the group-level score key
-        await r.delete(base_key)
-
-        # Scan and delete any per-document score keys
-        pattern = f"{base_key}:doc:*"
-        cursor: int | str = 0
-        while True:
-            cursor, keys = await r.scan(cursor=cursor, match=pattern, count=200)
-            if keys:
-                await r.delete(*keys)
-            if int(cursor) == 0:
-                break
+        # Always drop the group-level score key, plus any per-document score keys
+        await _unlink_matching(_get_redis(), f"{base_key}:doc:*", base_key)
     except Exception as e:
         cache_logger.warning(
             "Cache invalidation error for user %s in %s: %s",
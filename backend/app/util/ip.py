@@ -2,6 +2,9 @@ import ipaddress
 
 from starlette.requests import HTTPConnection
 
+_FORWARDED_FOR = b"x-forwarded-for"
+_REAL_IP = b"x-real-ip"
+
 
 def get_client_ip(conn: HTTPConnection) -> str:
     """Extract client IP from proxy headers or direct connection.
@@ -14,15 +17,21 @@ def get_client_ip(conn: HTTPConnection) -> str:
     2. X-Real-IP (alternative proxy header)
     3. Direct connection IP (fallback for non-proxied requests)
     """
+    # Single pass over the raw ASGI headers (names are already lower-cased bytes)
+    forwarded_for = real_ip = None
+    for name, value in conn.scope["headers"]:
+        if name == _FORWARDED_FOR and forwarded_for is None:
+            forwarded_for = value
+        elif name == _REAL_IP and real_ip is None:
+            real_ip = value
+
     # X-Forwarded-For contains comma-separated list, first is original
-    forwarded_for = conn.headers.get("X-Forwarded-For")
     if forwarded_for:
-        return forwarded_for.split(",")[0].strip()
+        return forwarded_for.partition(b",")[0].strip().decode("latin-1")
 
     # Fallback to X-Real-IP
-    real_ip = conn.headers.get("X-Real-IP")
     if real_ip:
-        return real_ip
+        return real_ip.decode("latin-1")
 
     # Last resort: direct connection (works for non-proxied requests)
     return conn.client.host if conn.client else "unknown"
@@ -1,4 +1,4 @@
-import inspect
+from typing import Any
 
 from core.logger import get_logger
 from fastapi import FastAPI
@@ -6,9 +6,32 @@ from models.document import DocumentCreate
 
 logger = get_logger("openapi")
 
+# Embedded websocket tester appended to the description of the event routes
+IFRAME_HTML = "<iframe src='/docs/websocket' style='width: 100%; height: 600px; border: none;'></iframe>"
 
-def custom_openapi(app: FastAPI) -> None:  # noqa: C901
-    """Customize the openapi schema"""
+# Schema and per-parameter examples for the deepObject style filter and sort query params.
+# Shared by reference across all operations, the schema is only serialized, never mutated.
+_DEEP_OBJECT_SCHEMA = {"type": "object", "properties": {}}
+_DEEP_OBJECT_EXAMPLES = {
+    "filter": {"[field][operator]": "value"},
+    "sort": {"[field1]": "asc", "[field2]": "desc"},
+}
+
+# Sort rank of pinned tags, every other tag ranks _DEFAULT_TAG_RANK and is ordered by name
+_TAG_RANK = {"Register": 0, "Login": 1, "Logout": 2, "WebSocket Events": 4}
+_DEFAULT_TAG_RANK = 3
+
+# Guards found per route, keyed by id() since APIRoute is unhashable. Routes live as long as the app.
+_GUARD_CACHE: dict[int, tuple] = {}
+# Field exclusion notice per route, empty for routes whose guards exclude nothing
+_EXCLUSION_NOTICE_CACHE: dict[int, str] = {}
+
+
+def custom_openapi(app: FastAPI) -> dict[str, Any]:  # noqa: C901
+    """Customize the openapi schema.
+
+    The schema is built and post-processed once, then served from ``app.openapi_schema``.
+    """
     if app.openapi_schema:
         return app.openapi_schema
 
@@ -28,110 +51,122 @@ def custom_openapi(app: FastAPI) -> None:  # noqa: C901
 
     # Build the tags section dynamically if missing
     if "tags" not in openapi_schema:
-        tag_names = set()
-        for route in app.routes:
-            if hasattr(route, "tags"):
-                tag_names.update(route.tags)
+        # dict.fromkeys dedupes in a single pass, keeping first-seen order
+        tag_names = dict.fromkeys(tag for route in app.routes for tag in getattr(route, "tags", None) or ())
         openapi_schema["tags"] = [{"name": name} for name in tag_names]
 
-    # Sorts tags: Login first, Register second, WebSocket Events last, then alphabetically
-    openapi_schema["tags"].sort(
-        key=lambda x: (
-            x["name"] != "Register",
-            x["name"] != "Login",
-            x["name"] != "Logout",
-            x["name"] == "WebSocket Events",
-            x["name"],
-        )
-    )
+    # Sorts tags: Register, Login and Logout first, WebSocket Events last, the rest alphabetically in between
+    openapi_schema["tags"].sort(key=_tag_sort_key)
 
-    # Inject the websocket testing route into the OpenAPI schema dynamically
+    # Index routes by (path, method) in one pass, the post-processing below looks routes up instead of scanning app.routes.
+    # The first registered route wins, like the route FastAPI itself would dispatch to.
+    route_index: dict[tuple[str, str], object] = {}
     for route in app.routes:
-        if hasattr(route, "path") and "/events" in route.path:
-            for path, methods in openapi_schema["paths"].items():
-                if path == route.path:
-                    for _, details in methods.items():
-                        if "description" in details:
-                            details["description"] += (
-                                "\n\n<iframe src='/docs/websocket' style='width: 100%; height: 600px; border: none;'></iframe>"
-                            )
-                        else:
-                            details["description"] = (
-                                "<iframe src='/docs/websocket' style='width: 100%; height: 600px; border: none;'></iframe>"
-                            )
+        route_path = getattr(route, "path", None)
+        if route_path is None:
+            continue
+        for route_method in getattr(route, "methods", None) or ():
+            route_index.setdefault((route_path, route_method.upper()), route)
+
+    # Inject the websocket testing route into the OpenAPI schema dynamically (once per path, even if
+    # the websocket and its documentation route share it)
+    paths = openapi_schema["paths"]
+    for event_path in {route_path for route_path, _ in route_index if "/events" in route_path}:
+        methods = paths.get(event_path)
+        if not methods:
+            continue
+        for details in methods.values():
+            if "description" in details:
+                details["description"] += "\n\n" + IFRAME_HTML
+            else:
+                details["description"] = IFRAME_HTML
 
     # Add deepObject style to filter and sort params
-    for path, methods in openapi_schema["paths"].items():
+    for path, methods in paths.items():
         for method_name, method in methods.items():
             parameters = method.get("parameters", [])
             for param in parameters:
-                if param["name"] == "filter":
+                example = _DEEP_OBJECT_EXAMPLES.get(param["name"])
+                if example is not None:
                     # set deepObject style
                     param["style"] = "deepObject"
                     param["explode"] = True
-                    param["schema"] = {"type": "object", "properties": {}}
-                    param["example"] = {"[field][operator]": "value"}
-                if param["name"] == "sort":
-                    # set deepObject style
-                    param["style"] = "deepObject"
-                    param["explode"] = True
-                    param["schema"] = {"type": "object", "properties": {}}
-                    param["example"] = {"[field1]": "asc", "[field2]": "desc"}
+                    param["schema"] = _DEEP_OBJECT_SCHEMA
+                    param["example"] = example
 
             # Auto-inject guard exclusion descriptions
             if "description" in method:
                 # Find the corresponding route to extract guards
-                for route in app.routes:
-                    if hasattr(route, "path") and hasattr(route, "methods"):
-                        if route.path == path and method_name.upper() in route.methods:
-                            # Check if route uses PaginatedResource with guards
-                            guards = _extract_guards_from_route(route)
-                            if guards:
-                                guard_exclusions = []
-                                for guard in guards:
-                                    if hasattr(guard, "get_excluded_fields"):
-                                        excluded = guard.get_excluded_fields()
-                                        if excluded:
-                                            guard_exclusions.extend(excluded)
-
-                                if guard_exclusions:
-                                    excluded_fields = "', '".join(sorted(set(guard_exclusions)))
-                                    exclusion_notice = (
-                                        f"<br/><br/><strong>Field Exclusions:</strong> The following fields are always excluded from this endpoint's "
-                                        f"responses due to access control rules: <code>{excluded_fields}</code>"
-                                    )
-                                    method["description"] = method["description"] + exclusion_notice
-                            break
-
+                route = route_index.get((path, method_name.upper()))
+                if route is not None:
+                    # Check if route uses PaginatedResource with guards
+                    exclusion_notice = _exclusion_notice(route)
+                    if exclusion_notice:
+                        method["description"] = method["description"] + exclusion_notice
+
+    app.openapi_schema = openapi_schema
     return openapi_schema
 
 
-def _extract_guards_from_route(route: object) -> list:  # noqa: C901
-    """Extract guards from a route's PaginatedResource dependency."""
+def _tag_sort_key(tag: dict[str, Any]) -> tuple[int, str]:
+    """Return the sort key of an OpenAPI tag entry, its pinned rank then its name."""
+    name = tag["name"]
+    return _TAG_RANK.get(name, _DEFAULT_TAG_RANK), name
+
+
+def _exclusion_notice(route: object) -> str:
+    """Build the field exclusion notice for a route's guards, or an empty string if nothing is excluded.
+
+    Cached per route like the guards themselves, so the notice is built once however many methods share the route.
+    """
+    cached = _EXCLUSION_NOTICE_CACHE.get(id(route))
+    if cached is not None:
+        return cached
+
+    guard_exclusions = []
+    for guard in _extract_guards_from_route(route):
+        excluded = guard.get_excluded_fields()
+        if excluded:
+            guard_exclusions.extend(excluded)
+
+    notice = ""
+    if guard_exclusions:
+        excluded_fields = "', '".join(sorted(set(guard_exclusions)))
+        notice = (
+            f"<br/><br/><strong>Field Exclusions:</strong> The following fields are always excluded from this endpoint's "
+            f"responses due to access control rules: <code>{excluded_fields}</code>"
+        )
+    _EXCLUSION_NOTICE_CACHE[id(route)] = notice
+    return notice
+
+
+def _extract_guards_from_route(route: object) -> tuple:
+    """Extract the guards of a route's Authenticate and PaginatedResource dependencies.
+
+    Cached per route, operations sharing a route (e.g. GET and HEAD) walk its dependency tree once.
+    """
+    cached = _GUARD_CACHE.get(id(route))
+    if cached is not None:
+        return cached
+
     guards = []
 
-    if not hasattr(route, "dependant"):
-        return guards
-
-    # Recursively search through dependencies
-    def search_dependencies(dependant: object) -> None:
-        if hasattr(dependant, "call"):
-            # Check if this is a PaginatedResource by inspecting closure
-            if hasattr(dependant.call, "__closure__") and dependant.call.__closure__:
-                for cell in dependant.call.__closure__:
-                    try:
-                        if isinstance(cell.cell_contents, (list, tuple)):
-                            # Check if it's a list of guards
-                            for item in cell.cell_contents:
-                                if hasattr(item, "get_excluded_fields"):
-                                    guards.append(item)
-                    except (AttributeError, ValueError):
-                        pass
-
-        # Recursively check dependencies
-        if hasattr(dependant, "dependencies"):
-            for dep in dependant.dependencies:
-                search_dependencies(dep)
-
-    search_dependencies(route.dependant)
-    return guards
+    root = getattr(route, "dependant", None)
+    if root is None:
+        _GUARD_CACHE[id(route)] = ()
+        return ()
+
+    # Depth-first walk over the dependency tree with an explicit stack
+    stack = [root]
+    while stack:
+        dependant = stack.pop()
+        # Authenticate and PaginatedResource attach their guards to the dependency they return
+        guards.extend(getattr(getattr(dependant, "call", None), "guards", ()))
+
+        dependencies = getattr(dependant, "dependencies", None)
+        if dependencies:
+            # Reversed so dependencies are visited in declaration order
+            stack.extend(reversed(dependencies))
+
+    _GUARD_CACHE[id(route)] = result = tuple(guards)
+    return result
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import wraps
 from typing import Any, Literal
 
 from core.app_exception import AppException
@@ -22,13 +25,49 @@ from models.tables import (
     ShareLink,
     User,
 )
-from sqlalchemy import and_, false, or_, select, true
+from sqlalchemy import and_, case, false, or_, select, true
 from sqlalchemy.sql import ColumnElement
 from sqlmodel import SQLModel
 
 # TODO: I feel like there is a lot of duplicate code here that could be refactored by reusing guards, e.g. comment_access could reuse group_access to check group membership and then just add the visibility logic on top of that.
 
 
+@dataclass(slots=True, frozen=True)
+class _MembershipSnapshot:
+    """The parts of a user's group membership that the guard predicates look at."""
+
+    accepted: bool
+    is_owner: bool
+    permissions: frozenset[Permission]
+
+
+# Membership lookups shared by all predicate calls of one validator pass, keyed by (group id, user id)
+_membership_snapshots: ContextVar[dict[tuple[str, int], _MembershipSnapshot | None] | None] = ContextVar(
+    "membership_snapshots", default=None
+)
+
+
+def _user_membership(group: Group | None, user: User) -> _MembershipSnapshot | None:
+    """Return the user's membership in the group, reusing the lookup of the current validator pass if there is one."""
+    if group is None:
+        return None
+    cache = _membership_snapshots.get()
+    if cache is None:
+        return _find_membership(group, user)
+    key = (group.id, user.id)
+    if key not in cache:
+        cache[key] = _find_membership(group, user)
+    return cache[key]
+
+
+def _find_membership(group: Group, user: User) -> _MembershipSnapshot | None:
+    """Scan the group's memberships for the user's one."""
+    return next(
+        (_MembershipSnapshot(m.accepted, m.is_owner, frozenset(m.permissions)) for m in group.memberships if m.user_id == user.id),
+        None,
+    )
+
+
 class EndpointGuard[T]:
     """Encapsulates a permission rule with both a SQLAlchemy clause and a Python predicate."""
 
@@ -71,23 +110,72 @@ class EndpointGuard[T]:
 
         If this is used on a PaginatedResource, it will automatically map over the items in the pagination.
         """
+        # Bound once so the per-item path skips the class attribute lookups
+        validate_true = predicate_true_model.model_validate
+        validate_false = predicate_false_model.model_validate
+        predicate = self.predicate
+
+        def validate_item(obj: T, user: User | None) -> SQLModel:
+            if user and predicate(obj, user):
+                return validate_true(obj)
+            return validate_false(obj)
 
         def validator(obj: Paginated[T] | T, user: User | None) -> SQLModel:
             if isinstance(obj, Paginated):
-                obj.data = [self.validate(predicate_false_model, predicate_true_model)(item, user) for item in obj.data]
+                # Items of a page mostly share their groups, so look up the user's membership once per group
+                token = _membership_snapshots.set({})
+                try:
+                    obj.data = [validate_item(item, user) for item in obj.data]
+                finally:
+                    _membership_snapshots.reset(token)
                 return obj
-            if user and self.predicate(obj, user):
-                return predicate_true_model.model_validate(obj)
-            else:
-                return predicate_false_model.model_validate(obj)
+            return validate_item(obj, user)
+
+        return validator
+
 
-        return lambda obj, user: validator(obj, user)
+def _guard_cache_key(value: Any) -> Any:  # noqa: ANN401
+    """Turn a guard factory argument into a hashable cache key.
+
+    Permission sets are keyed by value. Column lists and columns are keyed by identity: SQLAlchemy
+    overloads ``==`` on them, and the cached guard keeps them referenced so their ids stay unique.
+    """
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(id(item) for item in value)
+    return id(value)
+
+
+def _memoized_guard[**P](factory: Callable[P, EndpointGuard]) -> Callable[P, EndpointGuard]:
+    """Cache the guards built by a Guard factory per argument combination.
+
+    Guards are stateless, so calls with equal arguments (e.g. per websocket event) share one instance
+    instead of re-creating the guard and its closures.
+    """
+    cache: dict[tuple, EndpointGuard] = {}
+
+    @wraps(factory)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> EndpointGuard:
+        key = (
+            tuple(_guard_cache_key(arg) for arg in args),
+            tuple(sorted((name, _guard_cache_key(value)) for name, value in kwargs.items())),
+        )
+        guard = cache.get(key)
+        if guard is None:
+            guard = cache[key] = factory(*args, **kwargs)
+        return guard
+
+    return wrapper
 
 
 class Guard:
     """Utility class for permission guards."""
 
     @staticmethod
+    @_memoized_guard
     def must_share_group() -> EndpointGuard[Membership]:
         """User can only access memberships of users that share at least one group with them."""
         # def clause(user: User, params: dict[str, Any], multi: bool = False) -> ColumnElement[bool]:
@@ -156,11 +244,13 @@ class Guard:
                 )
 
         def predicate(membership: Membership, user: User) -> bool:
-            return any(m.accepted and m.user_id == user.id for m in membership.group.memberships)
+            snapshot = _user_membership(membership.group, user)
+            return snapshot is not None and snapshot.accepted
 
         return EndpointGuard(clause, predicate)
 
     @staticmethod
+    @_memoized_guard
     def is_account_owner() -> EndpointGuard[User]:
         """User can only access their own account."""
 
@@ -188,7 +278,10 @@ class Guard:
                         error_code=AppErrorCode.INVALID_INPUT,
                         detail="Invalid user_id: must be an integer",
                     ) from None
-            return (User.id == user.id) & (User.id == target_user_id)
+            # Both ids are known here, so a mismatch is decided without asking the database
+            if target_user_id != user.id:
+                return false()
+            return User.id == user.id
 
         def predicate(user: User, session_user: User) -> bool:
             return user.id == session_user.id
@@ -196,6 +289,7 @@ class Guard:
         return EndpointGuard(clause, predicate)
 
     @staticmethod
+    @_memoized_guard
     def document_access(  # noqa: C901
         require_permissions: set[Permission] | None = None,
         *,
@@ -211,6 +305,33 @@ class Guard:
             exclude_fields: List of model fields to exclude from responses
 
         """
+        required = frozenset(require_permissions or ())
+        # User independent parts of the clause, built once per guard instead of on every request
+        admin_bypass = or_(
+            Membership.is_owner.is_(True),
+            Membership.permissions.contains([Permission.ADMINISTRATOR.value]),
+        )
+        # Verify membership has required permissions for public docs
+        has_required_permissions_for_public = (
+            Membership.permissions.contains(require_permissions) if require_permissions else true()
+        )
+        # Whether a membership in the document's group grants access, for either visibility
+        membership_grants_access = or_(
+            # Private documents: owner and admins only
+            and_(
+                Document.visibility == DocumentVisibility.PRIVATE,
+                admin_bypass,
+            ),
+            # Public documents: owner/admins OR accepted members with required permissions
+            and_(
+                Document.visibility == DocumentVisibility.PUBLIC,
+                Membership.accepted.is_(True),
+                or_(
+                    admin_bypass,
+                    has_required_permissions_for_public,
+                ),
+            ),
+        )
 
         def clause(user: User, params: dict[str, Any], multi: bool = False) -> ColumnElement[bool]:
             document_id = params.get("document_id", None)
@@ -221,49 +342,26 @@ class Guard:
                     detail="Endpoint Guard misconfiguration: missing document_id parameter",
                 )
 
-            def has_required_permissions_for_public() -> ColumnElement[bool]:
-                """Verify membership has required permissions for public docs."""
-                if not require_permissions:
-                    return true()
-                return and_(*(Membership.permissions.contains([p.value]) for p in require_permissions))
-
             def build_visibility_clause(
                 doc_id_filter: ColumnElement[bool] | None = None,
             ) -> ColumnElement[bool]:
-                """Build visibility clause, optionally filtering by document ID."""
+                """Build visibility clause, optionally filtering by document ID.
+
+                A single EXISTS on the user's membership in the document's group covers every visibility,
+                Postgres turns it into one semi-join on the membership primary key.
+                """
                 base_conditions = [doc_id_filter] if doc_id_filter is not None else []
-                admin_bypass = or_(
-                    Membership.is_owner.is_(True),
-                    Membership.permissions.contains([Permission.ADMINISTRATOR.value]),
-                )
 
-                return or_(
-                    # Private documents: owner and admins only
-                    and_(
-                        *base_conditions,
-                        Document.visibility == DocumentVisibility.PRIVATE,
-                        Document.group_id.in_(
-                            select(Membership.group_id).where(
-                                Membership.user_id == user.id,
-                                admin_bypass,
-                            )
-                        ),
-                    ),
-                    # Public documents: owner/admins OR accepted members with required permissions
-                    and_(
-                        *base_conditions,
-                        Document.visibility == DocumentVisibility.PUBLIC,
-                        Document.group_id.in_(
-                            select(Membership.group_id).where(
-                                Membership.user_id == user.id,
-                                Membership.accepted.is_(True),
-                                or_(
-                                    admin_bypass,
-                                    has_required_permissions_for_public(),
-                                ),
-                            )
-                        ),
-                    ),
+                return and_(
+                    *base_conditions,
+                    select(Membership.group_id)
+                    .where(
+                        Membership.user_id == user.id,
+                        Membership.group_id == Document.group_id,
+                        membership_grants_access,
+                    )
+                    .correlate(Document)
+                    .exists(),
                 )
 
             if multi and document_id is None:
@@ -274,31 +372,28 @@ class Guard:
                 return build_visibility_clause()
 
         def predicate(doc: Document, user: User) -> bool:
-            if doc.group is None:
+            snapshot = _user_membership(doc.group, user)
+            if snapshot is None:
                 return False
 
             if doc.visibility == DocumentVisibility.PRIVATE:
-                return any(
-                    m.user_id == user.id and (m.is_owner or Permission.ADMINISTRATOR.value in m.permissions) for m in doc.group.memberships
-                )
+                return snapshot.is_owner or Permission.ADMINISTRATOR in snapshot.permissions
             elif doc.visibility == DocumentVisibility.PUBLIC:
+                if not snapshot.accepted:
+                    return False
                 if not require_permissions:
-                    return any(m.accepted and m.user_id == user.id for m in doc.group.memberships)
-                return any(
-                    m.accepted
-                    and m.user_id == user.id
-                    and (
-                        m.is_owner
-                        or Permission.ADMINISTRATOR.value in m.permissions
-                        or all(p.value in m.permissions for p in require_permissions)
-                    )
-                    for m in doc.group.memberships
+                    return True
+                return (
+                    snapshot.is_owner
+                    or Permission.ADMINISTRATOR in snapshot.permissions
+                    or required <= snapshot.permissions
                 )
             return False
 
         return EndpointGuard(clause, predicate, exclude_fields=exclude_fields)
 
     @staticmethod
+    @_memoized_guard
     def group_access(
         require_permissions: set[Permission] | None = None,
         *,
@@ -318,6 +413,18 @@ class Guard:
                 unjoined FROM element.
 
         """
+        # User independent parts of the clause, built once per guard instead of on every request
+        if only_owner:
+            permission_clause = Membership.is_owner.is_(True)
+        else:
+            permission_clause = (
+                Membership.is_owner.is_(True)
+                | Membership.permissions.contains([Permission.ADMINISTRATOR.value])
+                | (Membership.permissions.contains(require_permissions) if require_permissions else true())
+            )
+        col = filter_column if filter_column is not None else Group.id
+        accepted_check = Membership.accepted.is_(True)
+        required = frozenset(require_permissions or ())
 
         def clause(user: User, params: dict[str, Any], multi: bool = False) -> ColumnElement[bool]:
             group_id = params.get("group_id", None)
@@ -328,25 +435,6 @@ class Guard:
                     detail="Endpoint Guard misconfiguration: missing group_id parameter",
                 )
 
-            def build_permission_clause() -> ColumnElement[bool]:
-                """Build permission check clause."""
-                if only_owner:
-                    return Membership.is_owner.is_(True)
-                else:
-                    return (
-                        Membership.is_owner.is_(True)
-                        | Membership.permissions.contains([Permission.ADMINISTRATOR.value])
-                        | (
-                            and_(*(Membership.permissions.contains([permission.value]) for permission in require_permissions))
-                            if require_permissions
-                            else true()
-                        )
-                    )
-
-            col = filter_column if filter_column is not None else Group.id
-
-            accepted_check = Membership.accepted.is_(True)
-
             if multi and group_id is None:
                 # For multi-item queries — use the caller-supplied column
                 # (defaults to Group.id for group queries, but should be
@@ -355,37 +443,36 @@ class Guard:
                     select(Membership.group_id).where(
                         Membership.user_id == user.id,
                         accepted_check,
-                        build_permission_clause(),
+                        permission_clause,
                     )
                 )
             elif not multi:
                 # For single group access checks - use EXISTS to avoid cross join
                 return (
                     select(Membership)
-                    .where((Membership.user_id == user.id) & (Membership.group_id == group_id) & accepted_check & build_permission_clause())
+                    .where((Membership.user_id == user.id) & (Membership.group_id == group_id) & accepted_check & permission_clause)
                     .exists()
                 )
             else:
-                return select(Membership).where((Membership.user_id == user.id) & accepted_check & build_permission_clause()).exists()
+                return select(Membership).where((Membership.user_id == user.id) & accepted_check & permission_clause).exists()
 
         def predicate(group: Group, user: User) -> bool:
-            required_vals: list[str] = [] if require_permissions is None else [p.value for p in require_permissions]
-
-            return any(
-                (m.user_id == user.id)
-                and m.accepted
-                and (
-                    m.is_owner
-                    if only_owner
-                    else (m.is_owner or Permission.ADMINISTRATOR.value in m.permissions or all(p in m.permissions for p in required_vals))
-                )
-                for m in group.memberships
+            snapshot = _user_membership(group, user)
+            if snapshot is None or not snapshot.accepted:
+                return False
+            if only_owner:
+                return snapshot.is_owner
+            return (
+                snapshot.is_owner
+                or Permission.ADMINISTRATOR in snapshot.permissions
+                or required <= snapshot.permissions
             )
 
         return EndpointGuard(clause, predicate, exclude_fields=exclude_fields)
 
     @staticmethod
-    def sharelink_access(  # noqa: C901
+    @_memoized_guard
+    def sharelink_access(
         *,
         exclude_fields: list[ColumnElement] | None = None,
     ) -> EndpointGuard[ShareLink]:
@@ -396,6 +483,8 @@ class Guard:
             exclude_fields: List of model fields to exclude from responses
 
         """
+        # Permission check clause, user independent so it is built once per guard
+        permission_clause = Membership.is_owner.is_(True) | Membership.permissions.contains([Permission.ADMINISTRATOR.value])
 
         def clause(user: User, params: dict[str, Any], multi: bool = False) -> ColumnElement[bool]:
             share_link_id = params.get("share_link_id", None)
@@ -419,10 +508,6 @@ class Guard:
                         detail="Invalid share_link_id: must be an integer",
                     ) from None
 
-            def build_permission_clause() -> ColumnElement[bool]:
-                """Build permission check clause."""
-                return Membership.is_owner.is_(True) | Membership.permissions.contains([Permission.ADMINISTRATOR.value])
-
             if multi:
                 # For multi-sharelink queries (filtering ShareLink table directly)
                 return ShareLink.group_id.in_(
@@ -430,7 +515,7 @@ class Guard:
                         Membership.user_id == user.id,
                         Membership.accepted.is_(True),
                         Membership.group_id == group_id if group_id is not None else true(),
-                        build_permission_clause(),
+                        permission_clause,
                     )
                 )
             elif share_link_id is not None:
@@ -444,7 +529,7 @@ class Guard:
                                 Membership.user_id == user.id,
                                 Membership.accepted.is_(True),
                                 Membership.group_id == group_id if group_id is not None else true(),
-                                build_permission_clause(),
+                                permission_clause,
                             )
                         )
                     )
@@ -460,7 +545,7 @@ class Guard:
                                 Membership.user_id == user.id,
                                 Membership.accepted.is_(True),
                                 Membership.group_id == group_id if group_id is not None else true(),
-                                build_permission_clause(),
+                                permission_clause,
                             )
                         )
                     )
@@ -474,12 +559,11 @@ class Guard:
                 )
 
         def predicate(share_link: ShareLink, user: User) -> bool:
-            if share_link.group is None:
-                return False
-
-            return any(
-                (m.user_id == user.id) and m.accepted and (m.is_owner or Permission.ADMINISTRATOR.value in m.permissions)
-                for m in share_link.group.memberships
+            snapshot = _user_membership(share_link.group, user)
+            return (
+                snapshot is not None
+                and snapshot.accepted
+                and (snapshot.is_owner or Permission.ADMINISTRATOR in snapshot.permissions)
             )
 
         return EndpointGuard(clause, predicate, exclude_fields=exclude_fields)
@@ -533,6 +617,7 @@ class Guard:
     # -------------------------------------------------------------------------------
 
     @staticmethod
+    @_memoized_guard
     def comment_access(  # noqa: C901
         require_permissions: set[Permission] | None = None,
         *,
@@ -540,6 +625,33 @@ class Guard:
         exclude_fields: list[ColumnElement] | None = None,
     ) -> EndpointGuard[Comment]:
         """User can access a comment based on its visibility, the document view_mode and the given required permissions."""
+        required = frozenset(require_permissions or ())
+        # User independent parts of the clause, built once per guard instead of on every request
+        # Helper: users with VIEW_RESTRICTED_COMMENTS permission (or admin/owner)
+        has_view_restricted_perm = or_(
+            Membership.is_owner.is_(True),
+            Membership.permissions.overlaps([Permission.VIEW_RESTRICTED_COMMENTS, Permission.ADMINISTRATOR]),
+        )
+        # Helper: additional permissions required for public comments (owner/admin bypass)
+        has_public_comment_perms = (
+            or_(
+                Membership.is_owner.is_(True),
+                Membership.permissions.contains([Permission.ADMINISTRATOR.value]),
+                Membership.permissions.contains(require_permissions),
+            )
+            if require_permissions
+            else true()
+        )
+        # What an accepted membership in the comment's document group must satisfy for a non author to see a
+        # restricted or public comment: restricted comments and public comments in restricted documents need
+        # VIEW_RESTRICTED_COMMENTS, public comments elsewhere (NULL view_mode counts as PUBLIC) the required permissions
+        membership_grants_visibility = case(
+            (
+                or_(Comment.visibility == Visibility.RESTRICTED, Document.view_mode == ViewMode.RESTRICTED),
+                has_view_restricted_perm,
+            ),
+            else_=has_public_comment_perms,
+        )
 
         def clause(user: User, params: dict[str, Any], multi: bool = False) -> ColumnElement[bool]:
             """Generate the SQLAlchemy clause for comment access, following the truth table exactly."""
@@ -571,117 +683,29 @@ class Guard:
                     # If only_owner is True, restrict to comments owned by the user
                     return and_(*base_conditions, Comment.user_id == user.id)
 
-                # Helper: users with VIEW_RESTRICTED_COMMENTS permission (or admin/owner)
-                has_view_restricted_perm = or_(
-                    Membership.is_owner.is_(True),
-                    Membership.permissions.contains([Permission.VIEW_RESTRICTED_COMMENTS.value]),
-                    Membership.permissions.contains([Permission.ADMINISTRATOR.value]),
-                )
-
-                # Rule 1: Private comments are only visible to the author (always)
-                private_comment_clause = and_(
-                    *base_conditions,
-                    Comment.visibility == Visibility.PRIVATE,
-                    Comment.user_id == user.id,
-                )
-
-                # Rule 2: Restricted comments are only visible to users with VIEW_RESTRICTED_COMMENTS (or author)
-                restricted_comment_clause = and_(
-                    *base_conditions,
-                    Comment.visibility == Visibility.RESTRICTED,
-                    or_(
-                        Comment.user_id == user.id,
-                        Comment.document.has(
-                            Document.group_id.in_(
-                                select(Membership.group_id).where(
-                                    Membership.user_id == user.id,
-                                    Membership.accepted.is_(True),
-                                    has_view_restricted_perm,
-                                )
-                            )
-                        ),
-                    ),
-                )
-
-                # Helper for public comments: member check with optional required permissions
-                def public_comment_member_check() -> ColumnElement[bool]:
-                    if not require_permissions:
-                        # No additional permissions required, any accepted member can access
-                        return or_(
-                            Comment.user_id == user.id,
-                            Comment.document.has(
-                                Document.group_id.in_(
-                                    select(Membership.group_id).where(
-                                        Membership.user_id == user.id,
-                                        Membership.accepted.is_(True),
-                                    )
-                                )
-                            ),
-                        )
-                    else:
-                        # Additional permissions required (owner/admin bypass)
-                        return or_(
-                            Comment.user_id == user.id,
-                            Comment.document.has(
-                                Document.group_id.in_(
-                                    select(Membership.group_id).where(
-                                        Membership.user_id == user.id,
-                                        Membership.accepted.is_(True),
-                                        or_(
-                                            Membership.is_owner.is_(True),
-                                            Membership.permissions.contains([Permission.ADMINISTRATOR.value]),
-                                            and_(*(Membership.permissions.contains([p.value]) for p in require_permissions)),
-                                        ),
-                                    )
-                                )
-                            ),
-                        )
-
-                # Rule 3: Public comments when document view_mode is PUBLIC
-                # - Visible to all accepted members (or author)
-                public_comment_public_doc_clause = and_(
-                    *base_conditions,
-                    Comment.visibility == Visibility.PUBLIC,
-                    Comment.document.has(Document.view_mode == ViewMode.PUBLIC),
-                    public_comment_member_check(),
+                # Everyone but the author needs an accepted membership in the document group that grants visibility,
+                # checked with one document/membership join instead of a subquery per rule
+                membership_grants = (
+                    select(Membership.group_id)
+                    .join(Document, Document.group_id == Membership.group_id)
+                    .where(
+                        Document.id == Comment.document_id,
+                        Membership.user_id == user.id,
+                        Membership.accepted.is_(True),
+                        membership_grants_visibility,
+                    )
+                    .correlate(Comment)
+                    .exists()
                 )
-
-                # Rule 4: Public comments when document view_mode is RESTRICTED
-                # - Only visible to users with VIEW_RESTRICTED_COMMENTS (or author)
-                public_comment_restricted_doc_clause = and_(
+                # Authors always see their own comments, private comments are only visible to them
+                return and_(
                     *base_conditions,
-                    Comment.visibility == Visibility.PUBLIC,
-                    Comment.document.has(Document.view_mode == ViewMode.RESTRICTED),
                     or_(
                         Comment.user_id == user.id,
-                        Comment.document.has(
-                            Document.group_id.in_(
-                                select(Membership.group_id).where(
-                                    Membership.user_id == user.id,
-                                    Membership.accepted.is_(True),
-                                    has_view_restricted_perm,
-                                )
-                            )
-                        ),
+                        and_(Comment.visibility != Visibility.PRIVATE, membership_grants),
                     ),
                 )
 
-                # Rule 5: Handle NULL view_mode as PUBLIC
-                public_comment_null_doc_clause = and_(
-                    *base_conditions,
-                    Comment.visibility == Visibility.PUBLIC,
-                    Comment.document.has(Document.view_mode.is_(None)),
-                    public_comment_member_check(),
-                )
-
-                return or_(
-                    private_comment_clause,
-                    restricted_comment_clause,
-                    public_comment_public_doc_clause,
-                    public_comment_restricted_doc_clause,
-                    public_comment_null_doc_clause,
-                )
-
             if multi and comment_id is None:
                 # For multi-comment queries (filtering Comment table directly)
                 return build_visibility_clause()
@@ -691,7 +715,30 @@ class Guard:
             else:
                 return build_visibility_clause()
 
-        def predicate(comment: Comment, user: User) -> bool:  # noqa: C901
+        # Python-side counterparts of the clause helpers, also fixed for the lifetime of the guard
+        def snapshot_has_view_restricted_perm(snapshot: _MembershipSnapshot | None) -> bool:
+            """Check if the membership has VIEW_RESTRICTED_COMMENTS permission (or admin/owner)."""
+            return (
+                snapshot is not None
+                and snapshot.accepted
+                and (
+                    snapshot.is_owner
+                    or Permission.VIEW_RESTRICTED_COMMENTS in snapshot.permissions
+                    or Permission.ADMINISTRATOR in snapshot.permissions
+                )
+            )
+
+        def snapshot_satisfies_public_comment_requirements(snapshot: _MembershipSnapshot | None) -> bool:
+            """Check if the membership satisfies the requirements for public comments."""
+            if snapshot is None or not snapshot.accepted:
+                return False
+            # If no required permissions, any accepted member can access
+            if not require_permissions:
+                return True
+            # If required permissions provided, need to be owner/admin OR have those permissions
+            return snapshot.is_owner or Permission.ADMINISTRATOR in snapshot.permissions or required <= snapshot.permissions
+
+        def predicate(comment: Comment, user: User) -> bool:
             """Run Python-side predicate for comment access, following the truth table exactly."""
             if only_owner:
                 return comment.user_id == user.id
@@ -700,32 +747,6 @@ class Guard:
             if document is None:
                 return False
 
-            # Helper: check if user has VIEW_RESTRICTED_COMMENTS permission (or admin/owner)
-            def user_has_view_restricted_perm() -> bool:
-                if document.group is None:
-                    return False
-                return any(
-                    m.accepted
-                    and m.user_id == user.id
-                    and (m.is_owner or Permission.VIEW_RESTRICTED_COMMENTS in m.permissions or Permission.ADMINISTRATOR in m.permissions)
-                    for m in document.group.memberships
-                )
-
-            # Helper: check if user satisfies requirements for public comments
-            def user_satisfies_public_comment_requirements() -> bool:
-                if document.group is None:
-                    return False
-                # If no required permissions, any accepted member can access
-                if not require_permissions:
-                    return any(m.accepted and m.user_id == user.id for m in document.group.memberships)
-                # If required permissions provided, need to be owner/admin OR have those permissions
-                return any(
-                    m.accepted
-                    and m.user_id == user.id
-                    and (m.is_owner or Permission.ADMINISTRATOR in m.permissions or all(p in m.permissions for p in require_permissions))
-                    for m in document.group.memberships
-                )
-
             # Rule 1: Authors always see their own comments
             if comment.user_id == user.id:
                 return True
@@ -736,23 +757,24 @@ class Guard:
 
             # Rule 3: Restricted comments are only visible to users with VIEW_RESTRICTED_COMMENTS
             if comment.visibility == Visibility.RESTRICTED:
-                return user_has_view_restricted_perm()
+                return snapshot_has_view_restricted_perm(_user_membership(document.group, user))
 
             # Rule 4: Public comments
             if comment.visibility == Visibility.PUBLIC:
                 document_view_mode = getattr(document, "view_mode", None)
                 if document_view_mode == ViewMode.RESTRICTED:
                     # Public comments in restricted documents need VIEW_RESTRICTED_COMMENTS
-                    return user_has_view_restricted_perm()
+                    return snapshot_has_view_restricted_perm(_user_membership(document.group, user))
                 else:
                     # Public comments in public documents are visible to accepted members (with required permissions if any)
-                    return user_satisfies_public_comment_requirements()
+                    return snapshot_satisfies_public_comment_requirements(_user_membership(document.group, user))
 
             return False
 
         return EndpointGuard(clause, predicate, exclude_fields=exclude_fields)
 
     @staticmethod
+    @_memoized_guard
     def reaction_access(
         *,
         only_owner: bool = False,
@@ -765,6 +787,7 @@ class Guard:
             exclude_fields: List of model fields to exclude from responses
 
         """
+        comment_guard = Guard.comment_access(None, only_owner=only_owner)
 
         def clause(user: User, params: dict[str, Any], multi: bool = False) -> ColumnElement[bool]:
             reaction_id = params.get("reaction_id", None)
@@ -793,7 +816,7 @@ class Guard:
                 return and_(
                     *base_conditions,
                     Reaction.comment_id.in_(
-                        select(Comment.id).where(Guard.comment_access(None, only_owner=only_owner).clause(user, params, multi=True))
+                        select(Comment.id).where(comment_guard.clause(user, params, multi=True))
                     ),
                 )
 
@@ -807,7 +830,7 @@ class Guard:
                 return build_clause()
 
         def predicate(reaction: Reaction, user: User) -> bool:
-            return Guard.comment_access(None, only_owner=only_owner).predicate(reaction.comment, user)
+            return comment_guard.predicate(reaction.comment, user)
 
         return EndpointGuard(clause, predicate, exclude_fields=exclude_fields)
 
@@ -0,0 +1,70 @@
+"""add trigger maintained sharelink num_memberships
+
+Revision ID: 0b5d8e27c4f6
+Revises: f92b06d4e1a3
+Create Date: 2026-10-17 01:26:44.017392
+
+Schema changes:
+  - Add ``sharelink.num_memberships`` and keep it in sync with an
+    AFTER INSERT/DELETE/UPDATE OF sharelink_id trigger on ``membership``.
+
+Data migration:
+  - Backfill the counter from the existing memberships.
+"""
+from typing import Sequence, Union
+import sqlmodel
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b5d8e27c4f6'
+down_revision: Union[str, None] = 'f92b06d4e1a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the counter column, backfill it and install the sync trigger."""
+    with op.batch_alter_table('sharelink', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('num_memberships', sa.Integer(), server_default='0', nullable=False))
+
+    op.execute(
+        """
+        UPDATE sharelink SET num_memberships = counts.total
+        FROM (SELECT sharelink_id, count(*) AS total FROM membership WHERE sharelink_id IS NOT NULL GROUP BY sharelink_id) AS counts
+        WHERE sharelink.id = counts.sharelink_id
+        """
+    )
+
+    op.execute(
+        """
+        CREATE FUNCTION sharelink_num_memberships_sync() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.sharelink_id IS NOT NULL THEN
+                UPDATE sharelink SET num_memberships = num_memberships - 1 WHERE id = OLD.sharelink_id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.sharelink_id IS NOT NULL THEN
+                UPDATE sharelink SET num_memberships = num_memberships + 1 WHERE id = NEW.sharelink_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER membership_sharelink_count
+        AFTER INSERT OR DELETE OR UPDATE OF sharelink_id ON membership
+        FOR EACH ROW EXECUTE FUNCTION sharelink_num_memberships_sync()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the sync trigger and the counter column."""
+    op.execute("DROP TRIGGER IF EXISTS membership_sharelink_count ON membership")
+    op.execute("DROP FUNCTION IF EXISTS sharelink_num_memberships_sync()")
+
+    with op.batch_alter_table('sharelink', schema=None) as batch_op:
+        batch_op.drop_column('num_memberships')
@@ -0,0 +1,64 @@
+"""store group default permissions as bitmask
+
+Revision ID: a8e6c2d94b17
+Revises: d5f1b8c3e702
+Create Date: 2026-10-17 03:21:40.372851
+
+Schema changes:
+  - Replace the ``group.default_permissions`` string array with a
+    smallint bitmask (see ``PermissionFlag``), matching ``membership`` and ``sharelink``.
+
+Data migration:
+  - Fold each stored permission name into its bit and back.
+"""
+from typing import Sequence, Union
+import sqlmodel
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8e6c2d94b17'
+down_revision: Union[str, None] = 'd5f1b8c3e702'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of PermissionFlag so later enum changes don't alter this migration
+_PERMISSION_BITS: dict[str, int] = {
+    "administrator": 1,
+    "add_comments": 2,
+    "view_restricted_comments": 4,
+    "add_reactions": 8,
+}
+
+
+def upgrade() -> None:
+    """Convert group default permissions from a string array to a bitmask."""
+    with op.batch_alter_table('group', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('permission_mask', sa.SmallInteger(), server_default='0', nullable=False))
+
+    mask_expr = " | ".join(
+        f"(CASE WHEN '{name}' = ANY(default_permissions) THEN {bit} ELSE 0 END)"
+        for name, bit in _PERMISSION_BITS.items()
+    )
+    op.execute(f'UPDATE "group" SET permission_mask = {mask_expr} WHERE default_permissions IS NOT NULL')
+
+    with op.batch_alter_table('group', schema=None) as batch_op:
+        batch_op.drop_column('default_permissions')
+        batch_op.alter_column('permission_mask', new_column_name='default_permissions')
+
+
+def downgrade() -> None:
+    """Convert group default permissions from a bitmask back to a string array."""
+    with op.batch_alter_table('group', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('permission_names', sa.ARRAY(sa.String()), nullable=True))
+
+    names_expr = ", ".join(
+        f"CASE WHEN default_permissions & {bit} <> 0 THEN '{name}' END"
+        for name, bit in _PERMISSION_BITS.items()
+    )
+    op.execute(f'UPDATE "group" SET permission_names = array_remove(ARRAY[{names_expr}]::varchar[], NULL)')
+
+    with op.batch_alter_table('group', schema=None) as batch_op:
+        batch_op.drop_column('default_permissions')
+        batch_op.alter_column('permission_names', new_column_name='default_permissions')
@@ -0,0 +1,110 @@
+"""add trigger maintained comment num_replies and group member_count
+
+Revision ID: b7d2f05e9a61
+Revises: a4c9e2f7b130
+Create Date: 2026-10-17 02:19:12.640913
+
+Schema changes:
+  - Add ``comment.num_replies`` and keep it in sync with an
+    AFTER INSERT/DELETE/UPDATE OF parent_id trigger on ``comment``.
+  - Add ``group.member_count`` and keep it in sync with an
+    AFTER INSERT/DELETE/UPDATE OF group_id trigger on ``membership``.
+
+Data migration:
+  - Backfill both counters from the existing rows.
+"""
+from typing import Sequence, Union
+import sqlmodel
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2f05e9a61'
+down_revision: Union[str, None] = 'a4c9e2f7b130'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the counter columns, backfill them and install the sync triggers."""
+    with op.batch_alter_table('comment', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('num_replies', sa.Integer(), server_default='0', nullable=False))
+
+    with op.batch_alter_table('group', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('member_count', sa.Integer(), server_default='0', nullable=False))
+
+    op.execute(
+        """
+        UPDATE comment SET num_replies = counts.total
+        FROM (SELECT parent_id, count(*) AS total FROM comment WHERE parent_id IS NOT NULL GROUP BY parent_id) AS counts
+        WHERE comment.id = counts.parent_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE "group" SET member_count = counts.total
+        FROM (SELECT group_id, count(*) AS total FROM membership GROUP BY group_id) AS counts
+        WHERE "group".id = counts.group_id
+        """
+    )
+
+    op.execute(
+        """
+        CREATE FUNCTION comment_num_replies_sync() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.parent_id IS NOT NULL THEN
+                UPDATE comment SET num_replies = num_replies - 1 WHERE id = OLD.parent_id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.parent_id IS NOT NULL THEN
+                UPDATE comment SET num_replies = num_replies + 1 WHERE id = NEW.parent_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER comment_reply_count
+        AFTER INSERT OR DELETE OR UPDATE OF parent_id ON comment
+        FOR EACH ROW EXECUTE FUNCTION comment_num_replies_sync()
+        """
+    )
+
+    op.execute(
+        """
+        CREATE FUNCTION group_member_count_sync() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE "group" SET member_count = member_count - 1 WHERE id = OLD.group_id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE "group" SET member_count = member_count + 1 WHERE id = NEW.group_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER membership_group_count
+        AFTER INSERT OR DELETE OR UPDATE OF group_id ON membership
+        FOR EACH ROW EXECUTE FUNCTION group_member_count_sync()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the sync triggers and the counter columns."""
+    op.execute("DROP TRIGGER IF EXISTS membership_group_count ON membership")
+    op.execute("DROP FUNCTION IF EXISTS group_member_count_sync()")
+    op.execute("DROP TRIGGER IF EXISTS comment_reply_count ON comment")
+    op.execute("DROP FUNCTION IF EXISTS comment_num_replies_sync()")
+
+    with op.batch_alter_table('group', schema=None) as batch_op:
+        batch_op.drop_column('member_count')
+
+    with op.batch_alter_table('comment', schema=None) as batch_op:
+        batch_op.drop_column('num_replies')
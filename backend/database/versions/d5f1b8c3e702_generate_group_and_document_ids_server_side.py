@@ -0,0 +1,69 @@
+"""generate group and document ids server side
+
+Revision ID: d5f1b8c3e702
+Revises: c3e8a1d64f27
+Create Date: 2026-10-17 03:02:18.904417
+
+Schema changes:
+  - Add the ``nanoid10()`` SQL function, a 10 character id over the
+    nanoid alphabet built from ``gen_random_uuid()`` bytes.
+  - Use it as the server default of ``group.id`` and ``document.id``.
+"""
+from typing import Sequence, Union
+import sqlmodel
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5f1b8c3e702'
+down_revision: Union[str, None] = 'c3e8a1d64f27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create nanoid10() and use it as the id server default."""
+    # The alphabet has 64 symbols, so the low 6 bits of a random byte index it without bias.
+    # Bytes 0-5 and 7-10 of a v4 uuid have fully random low 6 bits (byte 6 carries the version nibble).
+    op.execute(
+        """
+        CREATE FUNCTION nanoid10() RETURNS text AS $$
+            SELECT string_agg(
+                substr('_-0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ', (get_byte(r.b, i.n) & 63) + 1, 1),
+                '' ORDER BY i.n
+            )
+            FROM (SELECT uuid_send(gen_random_uuid()) AS b) AS r,
+                 unnest(ARRAY[0, 1, 2, 3, 4, 5, 7, 8, 9, 10]) AS i(n)
+        $$ LANGUAGE sql VOLATILE
+        """
+    )
+
+    with op.batch_alter_table('group', schema=None) as batch_op:
+        batch_op.alter_column('id',
+               existing_type=sa.VARCHAR(),
+               server_default=sa.text('nanoid10()'),
+               existing_nullable=False)
+
+    with op.batch_alter_table('document', schema=None) as batch_op:
+        batch_op.alter_column('id',
+               existing_type=sa.VARCHAR(),
+               server_default=sa.text('nanoid10()'),
+               existing_nullable=False)
+
+
+def downgrade() -> None:
+    """Drop the id server defaults and nanoid10()."""
+    with op.batch_alter_table('document', schema=None) as batch_op:
+        batch_op.alter_column('id',
+               existing_type=sa.VARCHAR(),
+               server_default=None,
+               existing_nullable=False)
+
+    with op.batch_alter_table('group', schema=None) as batch_op:
+        batch_op.alter_column('id',
+               existing_type=sa.VARCHAR(),
+               server_default=None,
+               existing_nullable=False)
+
+    op.execute("DROP FUNCTION IF EXISTS nanoid10()")
@@ -36,7 +36,6 @@ def discover_filter_models() -> list[type[BaseFilterModel]]:
             inspect.isclass(obj)
             and issubclass(obj, BaseFilterModel)
             and obj is not BaseFilterModel
-            and hasattr(obj, "get_filter_metadata")
         ):
             filter_models.append(obj)
     
@@ -0,0 +1,50 @@
+"""Tests for the guard discovery of the OpenAPI customization.
+
+Guards passed to ``Authenticate`` must be found like the ones passed to
+``PaginatedResource`` so their field exclusions show up in the route
+descriptions.
+"""
+
+from __future__ import annotations
+
+from api.dependencies.authentication import Authenticate
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from main import app
+from models.tables import Document, User
+from util.openapi import _exclusion_notice, _extract_guards_from_route
+from util.queries import Guard
+
+
+def _route(target: FastAPI, path: str, method: str) -> APIRoute:
+    """Return the route registered for path and method."""
+    return next(
+        route
+        for route in target.routes
+        if isinstance(route, APIRoute) and route.path == path and method in route.methods
+    )
+
+
+def test_authenticate_guards_are_discovered() -> None:
+    """The account owner guard of the export route is reported."""
+    route = _route(app, "/api/users/{user_id}/export", "GET")
+
+    assert _extract_guards_from_route(route) == (Guard.is_account_owner(),)
+
+
+def test_authenticate_guard_exclusions_in_description() -> None:
+    """Field exclusions of an Authenticate guard end up in the route description."""
+    guard = Guard.document_access(exclude_fields=[Document.storage_key])
+    test_app = FastAPI()
+
+    @test_app.get("/documents/{document_id}")
+    async def read_document(_user: User = Authenticate([guard])) -> None:
+        """Read a document."""
+
+    route = _route(test_app, "/documents/{document_id}", "GET")
+
+    assert _extract_guards_from_route(route) == (guard,)
+    assert _exclusion_notice(route) == (
+        "<br/><br/><strong>Field Exclusions:</strong> The following fields are always excluded from this endpoint's "
+        "responses due to access control rules: <code>storage_key</code>"
+    )
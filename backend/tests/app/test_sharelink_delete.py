@@ -0,0 +1,82 @@
+"""Tests for share link deletion.
+
+Deleting a share link must revoke the memberships that were granted
+through it, while memberships created by other means are kept.
+"""
+
+from __future__ import annotations
+
+from factories import models as f
+from models.enums import Permission
+from models.tables import Membership
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession as SQLModelAsyncSession
+
+
+async def test_delete_share_link_removes_its_memberships(
+    db: SQLModelAsyncSession,
+) -> None:
+    """Memberships granted through the link are gone after it is deleted."""
+    from api.routers.sharelinks import delete_share_link
+
+    owner = await db.run_sync(lambda s: f.UserFactory())
+    guest = await db.run_sync(lambda s: f.UserFactory())
+    group = await db.run_sync(lambda s: f.GroupFactory())
+
+    await db.run_sync(
+        lambda s: f.MembershipFactory(
+            user=owner,
+            group=group,
+            is_owner=True,
+            accepted=True,
+        )
+    )
+    share_link = await db.run_sync(
+        lambda s: f.ShareLinkFactory(
+            group=group,
+            created_by=owner,
+            permissions=[Permission.ADD_COMMENTS],
+        )
+    )
+    await db.run_sync(
+        lambda s: f.MembershipFactory(
+            user=guest,
+            group=group,
+            accepted=True,
+            share_link=share_link,
+        )
+    )
+    await db.flush()
+    share_link_id = share_link.id
+    # The factory filled share_link.memberships in memory; a share link loaded
+    # by the endpoint never has the collection loaded, so drop it here too
+    db.expire(share_link, ["memberships"])
+    assert "memberships" not in share_link.__dict__
+
+    response = await delete_share_link(
+        db=db,
+        _user=owner,
+        share_link=share_link,
+        _group=group,
+    )
+
+    assert response.status_code == 204
+
+    result = await db.exec(select(Membership).where(Membership.sharelink_id == share_link_id))
+    assert result.all() == []
+    result = await db.exec(
+        select(Membership).where(
+            Membership.group_id == group.id,
+            Membership.user_id == guest.id,
+        )
+    )
+    assert result.first() is None
+
+    # The owner's membership was not granted by the link and stays
+    result = await db.exec(
+        select(Membership).where(
+            Membership.group_id == group.id,
+            Membership.user_id == owner.id,
+        )
+    )
+    assert result.first() is not None
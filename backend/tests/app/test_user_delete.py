@@ -0,0 +1,52 @@
+"""Tests for deleting users.
+
+The user's collections are never loaded implicitly, so deleting a user
+must leave their memberships, comments and reactions to the database's
+ON DELETE CASCADE rules instead of the ORM blanking out foreign keys.
+"""
+
+from __future__ import annotations
+
+from factories import models as f
+from models.tables import Comment, Membership, Reaction
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession as SQLModelAsyncSession
+
+
+async def test_delete_user_with_memberships(
+    db: SQLModelAsyncSession,
+) -> None:
+    """Deleting a member removes their memberships, comments and reactions."""
+    user = await db.run_sync(lambda s: f.UserFactory())
+    other = await db.run_sync(lambda s: f.UserFactory())
+    group = await db.run_sync(lambda s: f.GroupFactory())
+    document = await db.run_sync(lambda s: f.DocumentFactory(group=group))
+
+    await db.run_sync(lambda s: f.MembershipFactory(user=other, group=group, is_owner=True))
+    await db.run_sync(lambda s: f.MembershipFactory(user=user, group=group))
+
+    comment = await db.run_sync(lambda s: f.CommentFactory(document=document, user=user, content="comment"))
+    other_comment = await db.run_sync(lambda s: f.CommentFactory(document=document, user=other, content="other"))
+    group_reaction = await db.run_sync(lambda s: f.GroupReactionFactory(group=group))
+    await db.run_sync(
+        lambda s: f.ReactionFactory(
+            user=user,
+            comment=other_comment,
+            group_reaction=group_reaction,
+        )
+    )
+    await db.flush()
+    user_id = user.id
+    comment_id = comment.id
+
+    await db.delete(user)
+    await db.flush()
+
+    memberships = (await db.exec(select(Membership).where(Membership.user_id == user_id))).all()
+    assert memberships == []
+    assert (await db.exec(select(Comment.id).where(Comment.id == comment_id))).first() is None
+    assert (await db.exec(select(Reaction).where(Reaction.user_id == user_id))).all() == []
+
+    # The other member's rows are untouched
+    remaining = (await db.exec(select(Membership).where(Membership.group_id == group.id))).all()
+    assert [m.user_id for m in remaining] == [other.id]
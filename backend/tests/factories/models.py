@@ -15,6 +15,7 @@ from models.tables import (
     ScoreConfig,
     ShareLink,
     User,
+    generate_share_link_token,
 )
 
 
@@ -52,14 +53,15 @@ class MembershipFactory(BaseFactory):
 
     @factory.post_generation
     def link(self, create: bool, extracted, **kwargs) -> None:  # noqa: ANN001, ANN003
-        """Ensure created Membership is visible on the related User and Group objects.
+        """Ensure created Membership is visible on the related Group object.
 
         Some tests evaluate Python-side predicates that rely on in-memory
-        relationship lists (e.g. group.memberships or user.memberships). When
-        factories persist objects using a session with "commit" persistence the
-        relationship collections may not be populated on detached instances. This
-        hook attempts to append the newly-created membership into the in-memory
-        collections when possible so predicates operate on expected objects.
+        relationship lists (e.g. group.memberships). When factories persist
+        objects using a session with "commit" persistence the relationship
+        collections may not be populated on detached instances. This hook
+        appends the newly-created membership into group.memberships so
+        predicates operate on expected objects. User.memberships raises on
+        access while unloaded, so it is left alone.
         """
         # Link membership into group membership list if present
         if getattr(self, "group", None) is not None:
@@ -69,13 +71,6 @@ class MembershipFactory(BaseFactory):
             if self not in self.group.memberships:
                 self.group.memberships.append(self)
 
-        # Link membership into user membership list if present
-        if getattr(self, "user", None) is not None:
-            if getattr(self.user, "memberships", None) is None:
-                self.user.memberships = []
-            if self not in self.user.memberships:
-                self.user.memberships.append(self)
-
 
 class DocumentFactory(BaseFactory):
     class Meta:
@@ -139,6 +134,6 @@ class ShareLinkFactory(BaseFactory):
     group = factory.SubFactory(GroupFactory)
     created_by = factory.SubFactory(UserFactory)
     permissions = factory.LazyFunction(lambda: [])
-    token = factory.LazyFunction(lambda: str(uuid4()))
+    token = factory.LazyFunction(generate_share_link_token)
     expires_at = factory.LazyFunction(lambda: datetime.now(UTC) + timedelta(days=7))
     label = factory.Faker("sentence")